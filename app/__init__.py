@@ -1,36 +1,55 @@
 from flask import Flask
+from functools import lru_cache
 from supabase import create_client
 from openai import OpenAI
+import httpx
+import importlib
 import os
 from config import SUPABASE_URL, SUPABASE_KEY, DEEPSEEK_API_KEY, DEEPSEEK_API_URL
 
-# Initialize Supabase globally
-supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
+@lru_cache(maxsize=1)
+def get_supabase():
+    """Supabase client, built lazily on first use"""
+    supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
 
-# Initialize OpenAI client
-client = OpenAI(api_key=DEEPSEEK_API_KEY, base_url=DEEPSEEK_API_URL)
+    # Replace the default PostgREST session with one that keeps connections
+    # alive in a bounded pool, so queries reuse the TLS session instead of
+    # paying a fresh TCP+TLS handshake on every call.
+    # Size max_connections to roughly gunicorn workers x threads; PostgREST
+    # itself pools Postgres connections, and any direct-DB tooling should
+    # use the Supavisor transaction-mode URI (SUPABASE_DB_URL in config.py)
+    supabase.postgrest.session = httpx.Client(
+        base_url=supabase.postgrest.session.base_url,
+        headers=supabase.postgrest.session.headers,
+        timeout=supabase.postgrest.session.timeout,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=40, keepalive_expiry=60),
+    )
+    return supabase
+
+@lru_cache(maxsize=1)
+def get_openai():
+    """OpenAI (DeepSeek) client, built lazily on first use"""
+    return OpenAI(api_key=DEEPSEEK_API_KEY, base_url=DEEPSEEK_API_URL)
+
+# Blueprints as string paths so modules are only imported when the app
+# is actually built, not when `app` is imported by tests or CLI tools
+_BLUEPRINTS = [
+    ("app.admin.routes", "admin", "/admin"),
+    ("app.users.routes", "users_bp", "/api"),
+    ("app.progress.routes", "progress", "/api/progress"),
+    ("app.chatbot.chatbot", "chatbot", "/api/chat"),
+    ("app.main.routes", "main", None),
+]
 
 def create_app():
     """Flask App Factory"""
     app = Flask(__name__)
 
-    # Import blueprints inside the function to avoid circular imports
-    from app.admin.routes import admin
-    from app.users.routes import users_bp
-    from app.progress.routes import progress
-    from app.chatbot.chatbot import chatbot
-    from app.main.routes import main
-    
-    # Register blueprints if not already registered
-    if "admin" not in app.blueprints:
-        app.register_blueprint(admin, url_prefix='/admin')
-    if "users" not in app.blueprints:
-        app.register_blueprint(users_bp, url_prefix='/api')
-    if "progress" not in app.blueprints:
-        app.register_blueprint(progress, url_prefix='/api/progress')
-    if "chatbot" not in app.blueprints:
-        app.register_blueprint(chatbot, url_prefix='/api/chat')
-    if "main" not in app.blueprints:
-        app.register_blueprint(main)
-        
+    # Import lazily inside the factory to avoid circular imports and to
+    # keep blueprint modules out of the import-time critical path
+    for module_path, attr, url_prefix in _BLUEPRINTS:
+        blueprint = getattr(importlib.import_module(module_path), attr)
+        if blueprint.name not in app.blueprints:
+            app.register_blueprint(blueprint, url_prefix=url_prefix)
+
     return app
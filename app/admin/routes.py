@@ -1,6 +1,7 @@
 from flask import Blueprint, request, jsonify
 from middlewares.auth import token_required, is_admin
-from app import supabase  
+from app import get_supabase
+from app.cache import articles_cache, ARTICLES_CACHE_KEY
 
 admin = Blueprint('admin', __name__)
 
@@ -17,7 +18,8 @@ def create_article(user):
     if not data or "title" not in data or "content" not in data:
         return jsonify({"error": "Missing required fields"}), 400
 
-    response = supabase.table("articles").insert(data).execute()
+    response = get_supabase().table("articles").insert(data).execute()
+    articles_cache.invalidate(ARTICLES_CACHE_KEY)
     return jsonify({"message": "Article added successfully!", "data": response.data})
 
 @admin.route('/articles/<string:article_id>', methods=['PUT'])
@@ -31,7 +33,8 @@ def update_article(user, article_id):
     if not data:
         return jsonify({"error": "No update data provided"}), 400
 
-    response = supabase.table("articles").update(data).eq("id", article_id).execute()
+    response = get_supabase().table("articles").update(data).eq("id", article_id).execute()
+    articles_cache.invalidate(ARTICLES_CACHE_KEY)
     return jsonify({"message": "Article updated successfully!", "data": response.data})
 
 @admin.route('/articles/<string:article_id>', methods=['DELETE'])
@@ -41,7 +44,8 @@ def delete_article(user, article_id):
     if not is_admin(user):
         return jsonify({"error": "Unauthorized: Admin access required"}), 403
 
-    response = supabase.table("articles").delete().eq("id", article_id).execute()
+    response = get_supabase().table("articles").delete().eq("id", article_id).execute()
+    articles_cache.invalidate(ARTICLES_CACHE_KEY)
     return jsonify({"message": "Article deleted successfully!"})
 
 ### --- Practice Questions Management (Admin Only) ---
@@ -57,7 +61,7 @@ def create_question(user):
     if not data or "title" not in data or "link" not in data or "difficulty" not in data:
         return jsonify({"error": "Missing required fields"}), 400
 
-    response = supabase.table("practicequestions").insert(data).execute()
+    response = get_supabase().table("practicequestions").insert(data).execute()
     return jsonify({"message": "Question added successfully!", "data": response.data})
 
 @admin.route('/questions/<int:question_id>', methods=['PUT'])
@@ -71,7 +75,7 @@ def update_question(user, question_id):
     if not data:
         return jsonify({"error": "No update data provided"}), 400
 
-    response = supabase.table("practicequestions").update(data).eq("id", question_id).execute()
+    response = get_supabase().table("practicequestions").update(data).eq("id", question_id).execute()
     return jsonify({"message": "Question updated successfully!", "data": response.data})
 
 @admin.route('/questions/<int:question_id>', methods=['DELETE'])
@@ -81,5 +85,5 @@ def delete_question(user, question_id):
     if not is_admin(user):
         return jsonify({"error": "Unauthorized: Admin access required"}), 403
 
-    response = supabase.table("practicequestions").delete().eq("id", question_id).execute()
+    response = get_supabase().table("practicequestions").delete().eq("id", question_id).execute()
     return jsonify({"message": "Question deleted successfully!"})
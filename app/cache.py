@@ -0,0 +1,55 @@
+import threading
+import time
+
+class TTLCache:
+    """Small thread-safe TTL cache for hot Supabase reads.
+
+    `maxsize` bounds the entry count for caches keyed on unbounded input
+    (e.g. free-form question text); when full, the entry closest to
+    expiry is evicted. Leave it None for caches with naturally few keys.
+    """
+    def __init__(self, ttl=30, maxsize=None):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._store = {}  # key -> (expiry, value)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is None:
+                return None
+            expiry, value = entry
+            if time.monotonic() > expiry:
+                del self._store[key]
+                return None
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            now = time.monotonic()
+            if self.maxsize is not None and key not in self._store:
+                # Drop everything already expired, then make room by
+                # evicting the entry due to expire soonest
+                expired = [k for k, (expiry, _) in self._store.items() if now > expiry]
+                for k in expired:
+                    del self._store[k]
+                if len(self._store) >= self.maxsize:
+                    oldest = min(self._store, key=lambda k: self._store[k][0])
+                    del self._store[oldest]
+            self._store[key] = (now + self.ttl, value)
+
+    def invalidate(self, key):
+        with self._lock:
+            self._store.pop(key, None)
+
+# Shared cache for the read-heavy articles endpoint
+articles_cache = TTLCache(ttl=30)
+ARTICLES_CACHE_KEY = "articles:all"
+
+# Cache for repeated AI-assist questions. Keyed on free-form question
+# text with multi-KB responses, so it is size-bounded unlike the others
+ai_response_cache = TTLCache(ttl=300, maxsize=16)
+
+# Short-lived cache of user_id -> role for the auth middleware
+role_cache = TTLCache(ttl=60)
@@ -1,9 +1,13 @@
-from flask import Blueprint, request, jsonify
-from app import supabase, client
+from flask import Blueprint, request, jsonify, Response, stream_with_context
+from app import get_supabase, get_openai
 from middlewares.auth import token_required
+import json
+import logging
 import uuid
 from datetime import datetime
 
+log = logging.getLogger(__name__)
+
 chatbot = Blueprint('chatbot', __name__)
 
 # Dictionary to store chat history for each user
@@ -31,6 +35,7 @@ def chat(user):
     try:
         data = request.get_json()
         prompt = data.get('prompt')
+        stream = bool(data.get('stream'))
         user_id = user["id"]
 
         if not prompt:
@@ -98,37 +103,54 @@ def chat(user):
             *chat_history[user_id],  # Include the chat history
         ]
 
+        if stream:
+            # Send tokens as SSE so the client renders from the first token
+            def generate():
+                completion = get_openai().chat.completions.create(
+                    model="deepseek-chat",
+                    messages=messages,
+                    stream=True
+                )
+                parts = []
+                for chunk in completion:
+                    delta = chunk.choices[0].delta.content or ""
+                    if delta:
+                        parts.append(delta)
+                        yield f"data: {json.dumps(delta)}\n\n"
+                _finish_chat(user_id, prompt, "".join(parts))
+
+            return Response(stream_with_context(generate()), mimetype='text/event-stream')
+
         # Get the AI response
-        response = client.chat.completions.create(
+        response = get_openai().chat.completions.create(
             model="deepseek-chat",
             messages=messages,
             stream=False
         )
 
         ai_response = response.choices[0].message.content
-
-        # Add the bot's response to the chat history
-        chat_history[user_id].append({"role": "assistant", "content": ai_response})
-
-        # Generate a new UUID for the interaction
-        interaction_id = str(uuid.uuid4())
-        timestamp = datetime.now().isoformat()
-
-        # Store interaction in Supabase
-        interaction_data = {
-            "id": interaction_id,
-            "user_id": user_id,
-            "user_query": prompt,
-            "bot_response": ai_response,
-            "timestamp": timestamp
-        }
-
-        supabase.table("chatbotinteractions").insert(interaction_data).execute()
+        _finish_chat(user_id, prompt, ai_response)
 
         return jsonify({
             "response": ai_response
         })
         
     except Exception as e:
-        print(f"Chat error: {str(e)}")
-        return jsonify({"error": "Failed to get AI response"}), 500
\ No newline at end of file
+        log.warning("Chat error: %s", e)
+        return jsonify({"error": "Failed to get AI response"}), 500
+
+def _finish_chat(user_id, prompt, ai_response):
+    """Record a completed exchange in the history and in Supabase"""
+    # Add the bot's response to the chat history
+    chat_history[user_id].append({"role": "assistant", "content": ai_response})
+
+    # Store interaction in Supabase
+    interaction_data = {
+        "id": str(uuid.uuid4()),
+        "user_id": user_id,
+        "user_query": prompt,
+        "bot_response": ai_response,
+        "timestamp": datetime.now().isoformat()
+    }
+
+    get_supabase().table("chatbotinteractions").insert(interaction_data).execute()
\ No newline at end of file
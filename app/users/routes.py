@@ -1,21 +1,35 @@
 from flask import Blueprint, request, jsonify
-from middlewares.auth import token_required  
-from app import supabase, client  # Import client from app
+from middlewares.auth import token_required
+from app import get_supabase, get_openai
+from app.cache import articles_cache, ai_response_cache, ARTICLES_CACHE_KEY
 from config import ADMIN_SECRET  # Load admin secret securely
+import hashlib
+import json
+import logging
 import re
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+log = logging.getLogger(__name__)
+
+# Shared pool for fire-and-forget writes and parallel Supabase reads
+_executor = ThreadPoolExecutor(max_workers=8)
 
 users_bp = Blueprint('users', __name__)
 
+# Compiled once at import so signups don't re-parse the pattern per request
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Captures the first fenced code block (optional language tag) in one pass
+_CODE_RE = re.compile(r"```(?:python)?\s*\n?(.*?)```", re.DOTALL)
+
 def is_valid_email(email):
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return _EMAIL_RE.match(email) is not None
 
 @users_bp.route('/signup', methods=['POST'])
 def signup():
     """User Registration (Email, Password, Username, Phone) with Admin Code"""
     data = request.get_json()
-    print("Received signup data:", data)  # Debug print
+    log.debug("Received signup data: %s", data)
     email = data.get("email")
     password = data.get("password")
     username = data.get("username")
@@ -29,6 +43,10 @@ def signup():
     if not is_valid_email(email):
         return jsonify({"error": "Invalid email format"}), 400
 
+    # Stored lowercase, so the plain unique index on users.email serves
+    # the existence lookup and still blocks case-variant duplicates
+    email = email.strip().lower()
+
     if len(password) < 6:
         return jsonify({"error": "Password must be at least 6 characters long"}), 400
 
@@ -37,29 +55,18 @@ def signup():
         role = "admin"
 
     try:
-        # First check if user exists
-        try:
-            existing_user = supabase.auth.get_user_by_email(email)
-            if existing_user:
-                # If user exists but email is not confirmed, resend verification
-                if not existing_user.email_confirmed_at:
-                    supabase.auth.resend({
-                        "type": "signup",
-                        "email": email
-                    })
-                    return jsonify({
-                        "message": "User exists but email not verified. Verification email resent.",
-                        "status": "resent"
-                    })
-                else:
-                    return jsonify({"error": "User already registered and verified"}), 400
-        except Exception as e:
-            print("User check error:", str(e))
-            # If user doesn't exist, proceed with signup
-            pass
+        # Cheap indexed lookup first; the users table can't tell us the
+        # confirmation state, so unverified accounts are pointed at the
+        # resend endpoint instead of guessing here
+        existing = get_supabase().table("users").select("id").eq("email", email).limit(1).execute().data
+        if existing:
+            return jsonify({
+                "error": "Email already registered. If you haven't verified "
+                         "your account, request a new link via /resend-verification."
+            }), 400
 
         # ✅ Sign up the user
-        response = supabase.auth.sign_up({
+        response = get_supabase().auth.sign_up({
             "email": email,
             "password": password,
             "data": {  
@@ -68,7 +75,7 @@ def signup():
                 "role": role  # ✅ Store role in metadata
             }
         })
-        print("Supabase response:", response)  # Debug print
+        log.debug("Supabase response: %s", response)
 
         if response.user is None:
             return jsonify({"error": "Signup failed. Check email format or try again."}), 400
@@ -84,7 +91,7 @@ def signup():
             "phone": phone,
             "role": role  
         }
-        supabase.table("users").insert(user_data).execute()
+        get_supabase().table("users").insert(user_data).execute()
 
         return jsonify({
             "message": "User registered successfully. Check your email to verify your account.",
@@ -92,7 +99,7 @@ def signup():
         })
 
     except Exception as e:
-        print("Signup error:", str(e))  # Debug print
+        log.error("Signup error: %s", e)
         return jsonify({"error": str(e)}), 500
 
 ### --- 🔑 User Login (Checks Email Confirmation) ---
@@ -104,7 +111,7 @@ def login():
     password = data.get("password")
 
     try:
-        response = supabase.auth.sign_in_with_password({"email": email, "password": password})
+        response = get_supabase().auth.sign_in_with_password({"email": email, "password": password})
 
         if hasattr(response, 'error') and response.error:
             return jsonify({"error": response.error.message}), 400
@@ -116,7 +123,8 @@ def login():
 
         return jsonify({
             "message": "Login successful",
-            "token": response.session.access_token
+            "token": response.session.access_token,
+            "expires_in": response.session.expires_in
         })
 
     except Exception as e:
@@ -130,7 +138,7 @@ def resend_confirmation():
     data = request.get_json()
     email = data.get("email")
     try:
-        response = supabase.auth.resend({"email": email})
+        response = get_supabase().auth.resend({"email": email})
 
         if response.error:
             return jsonify({"error": response.error.message}), 400
@@ -150,7 +158,7 @@ def google_login():
     access_token = data.get("access_token")  # Token from Google OAuth
 
     try:
-        response = supabase.auth.sign_in_with_id_token({"provider": "google", "id_token": access_token})
+        response = get_supabase().auth.sign_in_with_id_token({"provider": "google", "id_token": access_token})
 
         if response.error:
             return jsonify({"error": response.error.message}), 400
@@ -167,16 +175,48 @@ def google_login():
 def get_articles(user):
     """Get all articles for users to read"""
     try:
-        # Fetch articles from Supabase
-        response = supabase.table("articles").select("*").execute()
-        
-        if response.data:
-            return jsonify(response.data)
-        else:
-            return jsonify([])
-            
+        # Serve from the in-memory cache when fresh to skip the Supabase round-trip
+        cached = articles_cache.get(ARTICLES_CACHE_KEY)
+        if cached is None:
+            # Fetch articles from Supabase (only the columns the UI renders)
+            response = get_supabase().table("articles").select("id,title,content,category,created_at").execute()
+
+            articles = response.data if response.data else []
+            # ETag computed once per cache fill, not per request
+            etag = hashlib.md5(json.dumps(articles, sort_keys=True, default=str).encode()).hexdigest()
+            cached = (articles, etag)
+            articles_cache.set(ARTICLES_CACHE_KEY, cached)
+
+        articles, etag = cached
+
+        # Warm clients skip the payload entirely
+        if request.headers.get("If-None-Match") == etag:
+            return "", 304
+
+        resp = jsonify(articles)
+        resp.headers["ETag"] = etag
+        resp.headers["Cache-Control"] = "private, max-age=30"
+        return resp
+
     except Exception as e:
-        print(f"Error fetching articles: {str(e)}")
+        log.error("Error fetching articles: %s", e)
+        return jsonify({"error": "Failed to fetch articles"}), 500
+
+@users_bp.route('/articles/batch', methods=['POST'])
+@token_required
+def get_articles_batch(user):
+    """Fetch several articles in one request, keyed by id"""
+    data = request.get_json()
+    ids = data.get("ids") if data else None
+    if not ids:
+        return jsonify({})
+
+    try:
+        response = get_supabase().table("articles").select("id,title,category").in_("id", ids).execute()
+        return jsonify({str(article["id"]): article for article in (response.data or [])})
+
+    except Exception as e:
+        log.error("Error batch fetching articles: %s", e)
         return jsonify({"error": "Failed to fetch articles"}), 500
 
 ### --- 📚 Mark Practice Questions (Track Progress) ---
@@ -188,7 +228,7 @@ def mark_question_as_read(user, question_id):
         "user_id": user["id"],  
         "question_id": question_id
     }
-    response = supabase.table("userprogress").insert(progress_entry).execute()
+    response = get_supabase().table("userprogress").insert(progress_entry).execute()
     return jsonify(response.data)
 
 # TODO: fetch question from category not article 
@@ -196,8 +236,23 @@ def mark_question_as_read(user, question_id):
 @token_required
 def get_related_questions(user, article_id):
     """Users can view practice questions related to a specific article"""
+    # Single round-trip: article + category questions in one query
+    # (see sql/get_article_with_questions.sql)
+    try:
+        combined_response = get_supabase().rpc("get_article_with_questions", {"aid": article_id}).execute()
+        if combined_response.data:
+            combined = combined_response.data
+            article = combined.get("article") or {}
+            if not article.get('category'):
+                return jsonify({"error": "Article does not have a category"}), 400
+            return jsonify({"article": article, "related_questions": combined.get("related_questions", [])})
+        return jsonify({"error": "Article not found"}), 404
+    except Exception as e:
+        log.warning("get_article_with_questions RPC unavailable, falling back: %s", e)
+
+    # Fallback: per-table queries (used until the RPC is deployed)
     # Fetch the article to ensure it exists
-    response_article = supabase.table("articles").select("*").eq("id", article_id).execute()
+    response_article = get_supabase().table("articles").select("id,title,category").eq("id", article_id).execute()
     article = response_article.data
 
     if not article:
@@ -209,7 +264,7 @@ def get_related_questions(user, article_id):
         return jsonify({"error": "Article does not have a category"}), 400
 
     # Fetch related practice questions based on the article's category
-    response_questions = supabase.table("practicequestions").select("*").eq("category", category).execute()
+    response_questions = get_supabase().table("practicequestions").select("id,title,link,difficulty,category").eq("category", category).execute()
     questions = response_questions.data
 
     return jsonify({"article": article[0], "related_questions": questions})
@@ -220,22 +275,47 @@ def get_related_questions(user, article_id):
 def get_user_progress(user):
     """Get user's learning progress and analytics"""
     try:
-        # Get user's progress from userprogress table
-        progress_response = supabase.table("userprogress").select("*").eq("user_id", user["id"]).execute()
-        progress_data = progress_response.data if progress_response.data else []
+        # Single round-trip: the get_user_dashboard RPC (see sql/get_user_dashboard.sql)
+        # computes counts, role and progress rows server-side in one query
+        try:
+            dashboard_response = get_supabase().rpc("get_user_dashboard", {"uid": user["id"]}).execute()
+            if dashboard_response.data:
+                dashboard = dashboard_response.data
+                total_articles = dashboard.get("total_articles", 0)
+                completed_articles = dashboard.get("completed_articles", 0)
+                progress_percentage = (completed_articles / total_articles * 100) if total_articles > 0 else 0
+
+                return jsonify({
+                    "progress": {
+                        "total_articles": total_articles,
+                        "completed_articles": completed_articles,
+                        "progress_percentage": progress_percentage
+                    },
+                    "user_role": dashboard.get("role", "user"),
+                    "progress_data": dashboard.get("progress_data", [])
+                })
+        except Exception as e:
+            log.warning("get_user_dashboard RPC unavailable, falling back: %s", e)
+
+        # Fallback: per-table queries (used until the RPC is deployed),
+        # issued concurrently since they are independent I/O waits
+        progress_future = _executor.submit(
+            lambda: get_supabase().table("userprogress").select("article_id,question_id,completed_at").eq("user_id", user["id"]).execute()
+        )
+        articles_count_future = _executor.submit(
+            lambda: get_supabase().table("articles").select("id", count="exact", head=True).execute()
+        )
 
-        # Get all articles for reference
-        articles_response = supabase.table("articles").select("*").execute()
-        articles = articles_response.data if articles_response.data else []
+        progress_response = progress_future.result()
+        progress_data = progress_response.data if progress_response.data else []
+        total_articles = articles_count_future.result().count or 0
 
         # Calculate progress metrics
-        total_articles = len(articles)
         completed_articles = len(progress_data)
         progress_percentage = (completed_articles / total_articles * 100) if total_articles > 0 else 0
 
-        # Get user's role
-        user_response = supabase.table("users").select("role").eq("id", user["id"]).execute()
-        user_role = user_response.data[0].get("role") if user_response.data else "user"
+        # Role was already resolved (and cached) by token_required
+        user_role = user.get("role", "user")
 
         return jsonify({
             "progress": {
@@ -248,7 +328,7 @@ def get_user_progress(user):
         })
 
     except Exception as e:
-        print(f"Error fetching user progress: {str(e)}")
+        log.error("Error fetching user progress: %s", e)
         return jsonify({"error": "Failed to fetch user progress"}), 500
 
 @users_bp.route('/resend-verification', methods=['POST'])
@@ -262,7 +342,7 @@ def resend_verification():
 
     try:
         # Resend verification email using Supabase
-        response = supabase.auth.resend({
+        response = get_supabase().auth.resend({
             "type": "signup",
             "email": email
         })
@@ -272,7 +352,7 @@ def resend_verification():
         })
 
     except Exception as e:
-        print("Resend verification error:", str(e))
+        log.error("Resend verification error: %s", e)
         return jsonify({"error": str(e)}), 500
 
 @users_bp.route('/list-users', methods=['GET'])
@@ -280,21 +360,16 @@ def list_users():
     """List all users (Development only)"""
     try:
         # Fetch all users
-        response = supabase.table("users").select("*").execute()
+        response = get_supabase().table("users").select("id,email,username,role").execute()
         users = response.data
         
-        # Print users for debugging
-        print("\nRegistered Users:")
-        for user in users:
-            print(f"Email: {user.get('email')}")
-            print(f"Username: {user.get('username')}")
-            print(f"Role: {user.get('role')}")
-            print("---")
-            
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Registered users: %s", users)
+
         return jsonify(users)
 
     except Exception as e:
-        print("Error listing users:", str(e))
+        log.error("Error listing users: %s", e)
         return jsonify({"error": str(e)}), 500
 
 ### --- 🤖 AI Assistance for DSA Questions ---
@@ -308,6 +383,15 @@ def get_ai_assistance(user):
         
         if not question:
             return jsonify({"error": "Question is required"}), 400
+
+        # Identical questions skip the multi-second LLM call entirely
+        cached = ai_response_cache.get(question)
+        if cached is not None:
+            _executor.submit(_log_ai_interaction, user["id"], question, cached)
+            return jsonify({
+                "response": cached,
+                "code_example": extract_code_example(cached)
+            })
             
         # Optimize the prompt for faster response
         prompt = f"""As a DSA expert, please provide a clear and concise explanation for:
@@ -322,7 +406,7 @@ Focus on:
 Keep the response concise but informative."""
             
         # Call DeepSeek API for AI response with simpler configuration
-        response = client.chat.completions.create(
+        response = get_openai().chat.completions.create(
             model="deepseek-chat",
             messages=[
                 {"role": "system", "content": "You are a DSA expert tutor. Provide clear, concise explanations with code examples when relevant."},
@@ -334,41 +418,65 @@ Keep the response concise but informative."""
         
         # Extract the AI response
         ai_response = response.choices[0].message.content
-        
-        # Store the interaction in Supabase
-        interaction_data = {
-            "user_id": user["id"],
-            "question": question,
-            "ai_response": ai_response
-        }
-        supabase.table("ai_interactions").insert(interaction_data).execute()
-        
+        ai_response_cache.set(question, ai_response)
+
+        # Log the interaction in the background so the user gets the
+        # response without waiting on the Supabase insert
+        _executor.submit(_log_ai_interaction, user["id"], question, ai_response)
+
         return jsonify({
             "response": ai_response,
-            "code_example": extract_code_example(ai_response) if "```" in ai_response else None
+            "code_example": extract_code_example(ai_response)
         })
         
     except Exception as e:
-        print(f"AI assistance error: {str(e)}")
+        log.error("AI assistance error: %s", e)
         return jsonify({"error": "Failed to get AI response"}), 500
 
+def _log_ai_interaction(user_id, question, ai_response):
+    """Store an AI interaction in Supabase (runs off the request thread)"""
+    try:
+        get_supabase().table("ai_interactions").insert({
+            "user_id": user_id,
+            "question": question,
+            "ai_response": ai_response
+        }).execute()
+    except Exception as e:
+        log.error("Failed to log AI interaction: %s", e)
+
 def extract_code_example(response):
     """Extract code example from AI response if present"""
+    match = _CODE_RE.search(response)
+    return match.group(1).strip() if match else None
+
+### --- 📚 Mark Articles as Read (Batch) ---
+@users_bp.route('/articles/mark-read-batch', methods=['POST'])
+@token_required
+def mark_articles_as_read_batch(user):
+    """Mark several articles as read in a single upsert"""
+    data = request.get_json()
+    ids = data.get("ids") if data else None
+    if not ids:
+        return jsonify({"error": "ids is required"}), 400
+
     try:
-        # Look for code blocks in the response
-        if "```" in response:
-            # Split by code blocks
-            parts = response.split("```")
-            # Find the first code block
-            for i in range(1, len(parts), 2):
-                code = parts[i].strip()
-                # Remove language identifier if present
-                if code.startswith("python"):
-                    code = code[6:].strip()
-                return code
+        entries = [{"user_id": user["id"], "article_id": article_id} for article_id in ids]
+        response = get_supabase().table("userprogress").upsert(
+            entries,
+            on_conflict="user_id,article_id",
+            ignore_duplicates=True
+        ).execute()
+
+        return jsonify({
+            "message": "Progress saved",
+            "marked": len(response.data or [])
+        })
+
     except Exception as e:
-        print(f"Error extracting code: {str(e)}")
-    return None
+        if "23503" in str(e):
+            return jsonify({"error": "Article not found"}), 404
+        log.error("Error batch marking articles: %s", e)
+        return jsonify({"error": "Failed to save progress"}), 500
 
 ### --- 📚 Mark Article as Read ---
 @users_bp.route('/articles/<string:article_id>/mark-read', methods=['POST'])
@@ -376,29 +484,32 @@ def extract_code_example(response):
 def mark_article_as_read(user, article_id):
     """Mark an article as read for the current user"""
     try:
-        # Check if article exists
-        article_response = supabase.table("articles").select("*").eq("id", article_id).execute()
-        if not article_response.data:
-            return jsonify({"error": "Article not found"}), 404
-            
-        # Check if already marked as read
-        existing_progress = supabase.table("userprogress").select("*").eq("user_id", user["id"]).eq("article_id", article_id).execute()
-        if existing_progress.data:
-            return jsonify({"message": "Article already marked as read"}), 200
-            
-        # Mark article as read
+        # Single upsert: the unique (user_id, article_id) pair handles the
+        # "already read" case and the FK rejects unknown articles, so no
+        # pre-check queries are needed (see sql/userprogress_constraints.sql)
+        # completed_at is filled server-side by the column default
+        # (see sql/userprogress_constraints.sql)
         progress_entry = {
             "user_id": user["id"],
-            "article_id": article_id,
-            "completed_at": datetime.utcnow().isoformat()
+            "article_id": article_id
         }
-        response = supabase.table("userprogress").insert(progress_entry).execute()
-        
+        response = get_supabase().table("userprogress").upsert(
+            progress_entry,
+            on_conflict="user_id,article_id",
+            ignore_duplicates=True
+        ).execute()
+
+        if not response.data:
+            return jsonify({"message": "Article already marked as read"}), 200
+
         return jsonify({
             "message": "Article marked as read",
             "progress": response.data[0]
         })
-        
+
     except Exception as e:
-        print(f"Error marking article as read: {str(e)}")
+        # FK violation means the article id doesn't exist
+        if "23503" in str(e):
+            return jsonify({"error": "Article not found"}), 404
+        log.error("Error marking article as read: %s", e)
         return jsonify({"error": "Failed to mark article as read"}), 500
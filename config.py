@@ -8,6 +8,10 @@ load_dotenv(override=True)
 ADMIN_SECRET = os.getenv("ADMIN_SECRET")  # Change this before production
 SUPABASE_URL = os.getenv("SUPABASE_URL")  # Your Supabase project URL
 SUPABASE_KEY = os.getenv("SUPABASE_KEY")  # Your RLS key
+# Direct Postgres URI for scripts/migrations. Use the Supavisor
+# transaction-mode pooler (port 6543, ?pgbouncer=true) instead of port
+# 5432 so concurrent workers don't exhaust the database connection cap.
+SUPABASE_DB_URL = os.getenv("SUPABASE_DB_URL")
 DEEPSEEK_API_URL = os.getenv("DEEPSEEK_API_URL")
 DEEPSEEK_API_KEY = os.getenv("DEEPSEEK_API_KEY")
 
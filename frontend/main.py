@@ -1,10 +1,16 @@
 import streamlit as st
 import requests
+import asyncio
+import concurrent.futures
+import functools
+import hashlib
+import httpx
 import json
-from PIL import Image
+import orjson
+import re
+import types
 import os
-from dotenv import load_dotenv
-from supabase import create_client
+import time
 
 # Configure page with dark theme and wide layout
 st.set_page_config(
@@ -14,82 +20,186 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-load_dotenv()
+# .env is only needed when the environment isn't already configured
+if os.getenv('SUPABASE_URL') is None:
+    from dotenv import load_dotenv
+    load_dotenv()
 
 # Backend URL
 BACKEND_URL = "http://127.0.0.1:5000"
 
-# API endpoints
-API_ENDPOINTS = {
+# Question pool size backing the sidebar progress percentage
+TOTAL_QUESTIONS = 50
+_INV_TOTAL_PCT = 100.0 / TOTAL_QUESTIONS
+
+# API endpoints (read-only mapping, built once at import)
+API_ENDPOINTS = types.MappingProxyType({
     "signup": f"{BACKEND_URL}/api/signup",
     "login": f"{BACKEND_URL}/api/login",
     "articles": f"{BACKEND_URL}/api/articles",
     "progress": f"{BACKEND_URL}/api/user/progress",
     "chat": f"{BACKEND_URL}/api/chat/api/chat",
     "ai_assist": f"{BACKEND_URL}/api/ai/assist"
-}
+})
 
-# Get environment variables and create Supabase client
+# Get environment variables for the Supabase client
 SUPABASE_URL = os.getenv('SUPABASE_URL')
 SUPABASE_KEY = os.getenv('SUPABASE_KEY')
-supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
-
-# Add this after creating the supabase client
-try:
-    # Test backend connection
-    response = requests.get(f"{BACKEND_URL}/health")
-    if response.status_code == 200:
-        print("Connected to backend successfully")
-    else:
-        print("Backend connection failed:", response.text)
-except Exception as e:
-    print("Backend connection error:", str(e))
 
+@st.cache_resource
+def _supabase():
+    """Supabase client, imported and built only if something needs it"""
+    from supabase import create_client
+    return create_client(SUPABASE_URL, SUPABASE_KEY)
+
+@st.cache_resource
+def http():
+    """Shared pooled session so backend calls reuse keep-alive connections"""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=16)
+    session.mount("http://", adapter)
+    return session
+
+@functools.lru_cache(maxsize=4)
+def _auth_headers(token):
+    return {
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json"
+    }
+
+def auth_headers():
+    """Request headers for the logged-in user, rebuilt only on token change"""
+    return _auth_headers(st.session_state.token)
+
+async def _post_json(url, payload, headers, timeout=30):
+    """Async POST so slow AI calls don't hold a pooled sync connection"""
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        return await client.post(url, json=payload, headers=headers)
+
+async def _gather_json(urls, headers, timeout=10):
+    """Fetch several URLs concurrently; returns parsed JSON (or None) per URL"""
+    async with httpx.AsyncClient(headers=headers, timeout=timeout) as client:
+        async def fetch(url):
+            try:
+                resp = await client.get(url)
+                if resp.status_code == 200:
+                    return resp.json()
+            except Exception:
+                pass
+            return None
+        return await asyncio.gather(*[fetch(url) for url in urls])
+
+@st.cache_resource(ttl=300)
 def get_working_api_url():
+    """Find a reachable backend once per process instead of on every rerun"""
     possible_urls = [
         "http://127.0.0.1:5000",
         "http://localhost:5000"
     ]
     
-    st.write("🔍 Checking available backend servers...")
-    
-    for url in possible_urls:
-        try:
-            st.write(f"Trying to connect to: {url}")
-            response = requests.get(f"{url}/", timeout=2)
-            if response.status_code == 200:
-                st.success(f"✅ Found working backend at: {url}")
-                return url
-        except requests.exceptions.ConnectionError:
-            st.warning(f"❌ Could not connect to: {url}")
-        except Exception as e:
-            st.warning(f"❌ Error connecting to {url}: {str(e)}")
-    
-    st.error("❌ No working backend server found!")
-    st.info("""
-    To fix this:
-    1. Make sure the backend server is running
-    2. Open a new terminal
-    3. Navigate to the project root directory
-    4. Start the Flask server:
-       ```
-       python run.py
-       ```
-    5. You should see: "Running on http://127.0.0.1:5000"
-    """)
+    # Probe all candidates concurrently and take the first that answers,
+    # so a dead first URL doesn't cost its full timeout
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(possible_urls)) as ex:
+        futures = {ex.submit(http().get, f"{url}/", timeout=2): url for url in possible_urls}
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                if future.result().status_code == 200:
+                    return futures[future]
+            except Exception:
+                continue
     
     # Default fallback
     return "http://127.0.0.1:5000"
 
+@st.cache_data(ttl=30)
+def backend_healthy(url):
+    """Cached health probe so tabs don't re-ping the backend on each rerun"""
+    try:
+        http().get(f"{url}/", timeout=5)
+        return True
+    except Exception:
+        return False
+
+def show_backend_down_help():
+    st.error("❌ Cannot connect to the server. Please ensure the backend is running.")
+    st.code("""
+    # Start the backend server in a new terminal:
+    python run.py
+    """)
+
 API_BASE_URL = get_working_api_url()  # Dynamically find working URL
 
+class Bitset:
+    """Compact membership set for non-negative int ids"""
+    def __init__(self):
+        self._bits = bytearray()
+        self._count = 0  # maintained on add() so len() never rescans the bytes
+
+    def add(self, i):
+        byte = i >> 3
+        if byte >= len(self._bits):
+            self._bits.extend(b"\x00" * (byte - len(self._bits) + 1))
+        mask = 1 << (i & 7)
+        if not self._bits[byte] & mask:
+            self._bits[byte] |= mask
+            self._count += 1
+
+    def __contains__(self, i):
+        byte = i >> 3
+        return byte < len(self._bits) and bool(self._bits[byte] & (1 << (i & 7)))
+
+    def __len__(self):
+        return self._count
+
+def dbg(msg):
+    """Render debug status lines only when debug mode is on"""
+    if st.session_state.get("debug"):
+        st.write(msg)
+
 def init_session_state():
     if 'token' not in st.session_state:
         st.session_state.token = None
     if 'user_role' not in st.session_state:
         st.session_state.user_role = None
     if 'completed_questions' not in st.session_state:
-        st.session_state.completed_questions = set()
+        # Question ids are ints, so a bitset beats a set of boxed ints
+        st.session_state.completed_questions = Bitset()
+
+_MSG_RESENT = """
+✅ Verification email resent! 
+
+Please check your email for verification:
+1. Look in your inbox for an email from Supabase
+2. Check your spam folder if you don't see it
+3. Click the verification link in the email
+4. After verification, you can log in
+
+If you still don't receive the email, please try:
+1. Using a different email address
+2. Checking your spam folder
+3. Waiting a few minutes and trying again
+"""
+
+_MSG_SIGNUP_OK = """
+✅ Signup successful! 
+
+Please check your email for verification:
+1. Look in your inbox for an email from Supabase
+2. Check your spam folder if you don't see it
+3. Click the verification link in the email
+4. After verification, you can log in
+
+If you don't receive the email within a few minutes, please try signing up again.
+"""
+
+_MSG_ALREADY_REGISTERED = """
+This email is already registered. 
+
+If you haven't received the verification email:
+1. Check your spam folder
+2. Try using the 'Resend Verification Email' button below
+3. Or try using a different email address
+"""
 
 def signup():
     st.subheader("Sign Up")
@@ -120,7 +230,7 @@ def signup():
                 data["admin_code"] = admin_code
 
             try:
-                response = requests.post(
+                response = http().post(
                     API_ENDPOINTS["signup"],
                     headers={"Content-Type": "application/json"},
                     json=data
@@ -130,37 +240,14 @@ def signup():
                     response_data = response.json()
                     with success_container:
                         if response_data.get("status") == "resent":
-                            st.success("""
-                            ✅ Verification email resent! 
-                            
-                            Please check your email for verification:
-                            1. Look in your inbox for an email from Supabase
-                            2. Check your spam folder if you don't see it
-                            3. Click the verification link in the email
-                            4. After verification, you can log in
-                            
-                            If you still don't receive the email, please try:
-                            1. Using a different email address
-                            2. Checking your spam folder
-                            3. Waiting a few minutes and trying again
-                            """)
+                            st.success(_MSG_RESENT)
                         else:
-                            st.success("""
-                            ✅ Signup successful! 
-                            
-                            Please check your email for verification:
-                            1. Look in your inbox for an email from Supabase
-                            2. Check your spam folder if you don't see it
-                            3. Click the verification link in the email
-                            4. After verification, you can log in
-                            
-                            If you don't receive the email within a few minutes, please try signing up again.
-                            """)
+                            st.success(_MSG_SIGNUP_OK)
                         
                         # Add a resend verification button outside the form
                         if st.button("Resend Verification Email"):
                             try:
-                                resend_response = requests.post(
+                                resend_response = http().post(
                                     f"{API_BASE_URL}/resend-verification",
                                     headers={"Content-Type": "application/json"},
                                     json={"email": email}
@@ -176,14 +263,7 @@ def signup():
                         error_data = response.json()
                         error_msg = error_data.get("error", "Unknown error occurred")
                         if "already registered" in error_msg.lower():
-                            st.error("""
-                            This email is already registered. 
-                            
-                            If you haven't received the verification email:
-                            1. Check your spam folder
-                            2. Try using the 'Resend Verification Email' button below
-                            3. Or try using a different email address
-                            """)
+                            st.error(_MSG_ALREADY_REGISTERED)
                         else:
                             st.error(f"Signup failed: {error_msg}")
                     except ValueError:
@@ -197,8 +277,7 @@ def signup():
 def login():
     st.subheader("Login")
     
-    # Show the current API URL being used
-    st.info(f"API URL: {API_BASE_URL}")
+    dbg(f"API URL: {API_BASE_URL}")
     
     with st.form("login_form"):
         email = st.text_input("Email")
@@ -211,7 +290,7 @@ def login():
                 return
                 
             try:
-                response = requests.post(
+                response = http().post(
                     API_ENDPOINTS["login"],
                     headers={"Content-Type": "application/json"},
                     json={"email": email, "password": password},
@@ -222,6 +301,9 @@ def login():
                     data = response.json()
                     st.session_state.token = data.get("token", "default_token")
                     st.session_state.user_role = data.get("role", "user")
+                    # Remember expiry so tabs can skip doomed requests later
+                    expires_in = data.get("expires_in", 3600)
+                    st.session_state.token_expires_at = time.time() + expires_in - 30
                     st.success("✅ Login successful!")
                     st.rerun()
                 elif response.status_code == 401:
@@ -252,97 +334,125 @@ def login():
                 st.error(f"⚠️ Error: {str(e)}")
                 st.info("Please check if the backend server is running properly.")
 
-def display_articles():
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_articles(token):
+    """Article catalog, cached per token so reruns skip the network"""
+    response = http().get(
+        API_ENDPOINTS["articles"],
+        headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
+        timeout=10
+    )
+    response.raise_for_status()
+    # orjson parses the N-item list several times faster than stdlib json
+    return orjson.loads(response.content)
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _dashboard_data(token):
+    """First-paint fetches (articles + progress) issued in one gather"""
+    headers = dict(_auth_headers(token))
+
+    async def fetch():
+        async with httpx.AsyncClient(base_url=API_BASE_URL, headers=headers, timeout=10) as client:
+            return await asyncio.gather(
+                client.get("/api/articles"),
+                client.get("/api/user/progress"),
+                return_exceptions=True
+            )
+
+    articles_resp, progress_resp = asyncio.run(fetch())
+    articles = (orjson.loads(articles_resp.content)
+                if not isinstance(articles_resp, Exception) and articles_resp.status_code == 200
+                else None)
+    progress = (orjson.loads(progress_resp.content)
+                if not isinstance(progress_resp, Exception) and progress_resp.status_code == 200
+                else None)
+    return articles, progress
+
+def display_articles(prefetched=None):
     st.header("Learning Resources")
     
     if 'token' not in st.session_state or not st.session_state.token:
         st.error("Please login first")
         return
+
+    # Bail before a wasted round-trip if the token is already stale
+    if time.time() >= st.session_state.get("token_expires_at", 0):
+        st.error("Session expired. Please login again.")
+        st.session_state.token = None
+        st.rerun()
     
-    # Show the current API URL being used
-    st.info(f"API URL: {API_BASE_URL}")
+    dbg(f"API URL: {API_BASE_URL}")
     
-    headers = {
-        "Authorization": f"Bearer {st.session_state.token}",
-        "Content-Type": "application/json"
-    }
+    headers = auth_headers()
     
     try:
-        # First, check if the server is running with a health check
+        # Cached health check (30s TTL) instead of a probe per rerun
+        if not backend_healthy(API_BASE_URL):
+            show_backend_down_help()
+            return
+
+        # Cached article list (60s TTL) keyed on the user token, so widget
+        # interactions rerun only the render loop, not the fetch
         try:
-            health_check_url = f"{API_BASE_URL}/"
-            st.write(f"Checking server health at: {health_check_url}")
-            health_response = requests.get(health_check_url, timeout=5)
-            st.success(f"✅ Server is running. Status: {health_response.status_code}")
-        except requests.exceptions.ConnectionError:
-            st.error("❌ Cannot connect to the server. Please ensure the backend is running.")
-            st.code("""
-            # Run this command in a new terminal:
-            cd app/backend
-            python app.py
-            """)
+            articles = prefetched if prefetched is not None else _fetch_articles(st.session_state.token)
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code == 401:
+                st.error("Session expired or invalid token. Please login again.")
+                st.session_state.token = None
+                st.rerun()
+            else:
+                st.error(f"Error fetching articles. Status code: {e.response.status_code}")
             return
-        except Exception as e:
-            st.error(f"❌ Server health check error: {str(e)}")
+        except ValueError:
+            st.error("Invalid response format from server")
             return
-        
-        # Now fetch the articles
-        url = API_ENDPOINTS["articles"]
-        st.write(f"Fetching articles from: {url}")
-        
-        response = requests.get(
-            url,
-            headers=headers,
-            timeout=10
-        )
-        
-        st.write(f"Response status code: {response.status_code}")
-        
-        if response.status_code == 200:
-            try:
-                articles = response.json()
-                st.success(f"✅ Successfully retrieved {len(articles)} articles")
-                
-                if not articles:
-                    st.info("No articles available yet.")
-                else:
-                    # Initialize completed articles in session state if not exists
-                    if 'completed_articles' not in st.session_state:
-                        st.session_state.completed_articles = set()
-                    
-                    for article in articles:
-                        article_id = article.get('id')
-                        with st.expander(f"📚 {article.get('title', 'Untitled')}"):
-                            st.markdown(article.get('content', 'No content available'))
-                            
-                            # Add checkbox for article completion
-                            is_completed = article_id in st.session_state.completed_articles
-                            if st.checkbox("Mark as Completed", key=f"article_{article_id}", value=is_completed):
-                                try:
-                                    # Call backend to mark article as completed
-                                    mark_response = requests.post(
-                                        f"{API_BASE_URL}/api/articles/{article_id}/mark-read",
-                                        headers=headers,
-                                        timeout=5
-                                    )
-                                    
-                                    if mark_response.status_code == 200:
-                                        st.session_state.completed_articles.add(article_id)
-                                        st.success("✅ Article marked as completed!")
-                                    else:
-                                        st.error("Failed to mark article as completed")
-                                except Exception as e:
-                                    st.error(f"Error marking article as completed: {str(e)}")
-            except ValueError:
-                st.error("Invalid response format from server")
-                st.write("Response content:", response.text[:200] + "..." if len(response.text) > 200 else response.text)
-        elif response.status_code == 401:
-            st.error("Session expired or invalid token. Please login again.")
-            st.session_state.token = None
-            st.rerun()
+
+        if not articles:
+            st.info("No articles available yet.")
         else:
-            st.error(f"Error fetching articles. Status code: {response.status_code}")
-            st.write("Response content:", response.text)
+            # Initialize completed articles in session state if not exists
+            if 'completed_articles' not in st.session_state:
+                st.session_state.completed_articles = set()
+
+            pending = st.session_state.setdefault("_pending_marks", set())
+
+            for article in articles:
+                article_id = article.get('id')
+                with st.expander(f"📚 {article.get('title', 'Untitled')}"):
+                    st.markdown(article.get('content', 'No content available'))
+
+                    # Buffer completion toggles; one batched POST saves them all
+                    is_completed = (article_id in st.session_state.completed_articles
+                                    or article_id in pending)
+                    if st.checkbox("Mark as Completed", key=f"article_{article_id}", value=is_completed):
+                        if not is_completed:
+                            pending.add(article_id)
+                    else:
+                        # Unchecking drops an unsaved mark again
+                        pending.discard(article_id)
+
+            if pending:
+                if st.button(f"💾 Save progress ({len(pending)} pending)"):
+                    try:
+                        mark_response = http().post(
+                            f"{API_BASE_URL}/api/articles/mark-read-batch",
+                            headers=headers,
+                            data=orjson.dumps({"ids": list(pending)}),
+                            timeout=10
+                        )
+
+                        if mark_response.status_code == 200:
+                            st.session_state.completed_articles.update(pending)
+                            pending.clear()
+                            _fetch_articles.clear()
+                            # The tabs are fed from _dashboard_data, so its
+                            # ttl must not keep serving pre-save counts
+                            _dashboard_data.clear()
+                            st.success("✅ Progress saved!")
+                        else:
+                            st.error("Failed to save progress")
+                    except Exception as e:
+                        st.error(f"Error saving progress: {str(e)}")
             
     except requests.exceptions.Timeout:
         st.error("⚠️ Request timed out. The server took too long to respond.")
@@ -364,110 +474,120 @@ def display_articles():
         st.error(f"⚠️ Unexpected error: {str(e)}")
         st.info("Please check if the backend server is running properly.")
 
-def display_progress():
+@st.cache_data(persist="disk", show_spinner=False)
+def _article_details(ids, _token):
+    """Details for the completed-article list, persisted to disk.
+
+    Keyed on the id tuple alone (the token rotates, so the leading
+    underscore keeps it out of the cache key): while the completion set
+    is unchanged the analytics tab skips the batch request entirely,
+    even across app restarts.
+    """
+    response = http().post(
+        f"{API_BASE_URL}/api/articles/batch",
+        headers={"Authorization": f"Bearer {_token}", "Content-Type": "application/json"},
+        data=orjson.dumps({"ids": list(ids)}),
+        timeout=10
+    )
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+def display_progress(prefetched=None):
     st.header("Learning Analytics")
     
     if 'token' not in st.session_state or not st.session_state.token:
         st.error("Please login first")
         return
+
+    # Bail before a wasted round-trip if the token is already stale
+    if time.time() >= st.session_state.get("token_expires_at", 0):
+        st.error("Session expired. Please login again.")
+        st.session_state.token = None
+        st.rerun()
     
-    # Show the current API URL being used
-    st.info(f"API URL: {API_BASE_URL}")
+    dbg(f"API URL: {API_BASE_URL}")
     
-    headers = {
-        "Authorization": f"Bearer {st.session_state.token}",
-        "Content-Type": "application/json"
-    }
+    headers = auth_headers()
     
     try:
-        # First, check if the server is running with a health check
-        try:
-            health_check_url = f"{API_BASE_URL}/"
-            st.write(f"Checking server health at: {health_check_url}")
-            health_response = requests.get(health_check_url, timeout=5)
-            st.success(f"✅ Server is running. Status: {health_response.status_code}")
-        except requests.exceptions.ConnectionError:
-            st.error("❌ Cannot connect to the server. Please ensure the backend is running.")
-            st.code("""
-            # Run this command in a new terminal:
-            cd app/backend
-            python app.py
-            """)
-            return
-        except Exception as e:
-            st.error(f"❌ Server health check error: {str(e)}")
-            return
-        
-        # Now fetch the progress data
-        url = API_ENDPOINTS["progress"]
-        st.write(f"Fetching progress data from: {url}")
-        
-        response = requests.get(
-            url,
-            headers=headers,
-            timeout=10
-        )
-        
-        st.write(f"Response status code: {response.status_code}")
-        
-        if response.status_code == 200:
-            try:
-                data = response.json()
-                
-                # Display overall progress
-                st.subheader("Overall Progress")
-                progress = data.get("progress", {})
-                total_articles = progress.get("total_articles", 0)
-                completed_articles = progress.get("completed_articles", 0)
-                progress_percentage = progress.get("progress_percentage", 0)
-                
-                # Create columns for metrics
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("Total Articles", total_articles)
-                with col2:
-                    st.metric("Completed Articles", completed_articles)
-                with col3:
-                    st.metric("Progress", f"{progress_percentage:.1f}%")
-                
-                # Progress bar
-                st.progress(progress_percentage / 100)
-                
-                # Display detailed progress data
-                st.subheader("Completed Articles")
-                progress_data = data.get("progress_data", [])
-                if progress_data:
-                    for item in progress_data:
-                        with st.expander(f"Article ID: {item.get('article_id', 'N/A')}"):
-                            st.write(f"Completed at: {item.get('completed_at', 'N/A')}")
-                            
-                            # Fetch article details
-                            try:
-                                article_response = requests.get(
-                                    f"{API_BASE_URL}/api/articles/{item.get('article_id')}",
-                                    headers=headers,
-                                    timeout=5
-                                )
-                                if article_response.status_code == 200:
-                                    article = article_response.json()
-                                    st.write(f"Title: {article.get('title', 'N/A')}")
-                                    st.write(f"Category: {article.get('category', 'N/A')}")
-                            except Exception as e:
-                                st.error(f"Error fetching article details: {str(e)}")
-                else:
-                    st.info("No articles completed yet. Start learning to track your progress!")
-                
-            except ValueError:
-                st.error("Invalid response format from server")
-                st.write("Response content:", response.text[:200] + "..." if len(response.text) > 200 else response.text)
-        elif response.status_code == 401:
-            st.error("Session expired or invalid token. Please login again.")
-            st.session_state.token = None
-            st.rerun()
+        if prefetched is not None:
+            data = prefetched
         else:
-            st.error(f"Error fetching progress data. Status code: {response.status_code}")
-            st.write("Response content:", response.text)
+            # Cached health check (30s TTL) instead of a probe per rerun
+            if not backend_healthy(API_BASE_URL):
+                show_backend_down_help()
+                return
+
+            # Now fetch the progress data
+            url = API_ENDPOINTS["progress"]
+            dbg(f"Fetching progress data from: {url}")
+            
+            response = http().get(
+                url,
+                headers=headers,
+                timeout=10
+            )
+            
+            dbg(f"Response status code: {response.status_code}")
+            
+            if response.status_code == 401:
+                st.error("Session expired or invalid token. Please login again.")
+                st.session_state.token = None
+                st.rerun()
+            elif response.status_code != 200:
+                st.error(f"Error fetching progress data. Status code: {response.status_code}")
+                st.write("Response content:", response.text)
+                return
+            data = orjson.loads(response.content)
+
+        try:
+            # Display overall progress
+            st.subheader("Overall Progress")
+            progress = data.get("progress", {})
+            total_articles = progress.get("total_articles", 0)
+            completed_articles = progress.get("completed_articles", 0)
+            progress_percentage = progress.get("progress_percentage", 0)
+            
+            # Create columns for metrics
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Total Articles", total_articles)
+            with col2:
+                st.metric("Completed Articles", completed_articles)
+            with col3:
+                st.metric("Progress", f"{progress_percentage:.1f}%")
+            
+            # Progress bar
+            st.progress(progress_percentage / 100)
             
+            # Display detailed progress data
+            st.subheader("Completed Articles")
+            progress_data = data.get("progress_data", [])
+            if progress_data:
+                # One batched request for every completed article's details,
+                # skipped entirely while the completion set is unchanged
+                details = {}
+                try:
+                    details = _article_details(
+                        tuple(item.get('article_id') for item in progress_data),
+                        st.session_state.token,
+                    )
+                except Exception as e:
+                    st.error(f"Error fetching article details: {str(e)}")
+
+                for item in progress_data:
+                    article = details.get(str(item.get('article_id')))
+                    with st.expander(f"Article ID: {item.get('article_id', 'N/A')}"):
+                        st.write(f"Completed at: {item.get('completed_at', 'N/A')}")
+                        if article:
+                            st.write(f"Title: {article.get('title', 'N/A')}")
+                            st.write(f"Category: {article.get('category', 'N/A')}")
+            else:
+                st.info("No articles completed yet. Start learning to track your progress!")
+            
+        except ValueError:
+            st.error("Invalid response format from server")
+        
     except requests.exceptions.Timeout:
         st.error("⚠️ Request timed out. The server took too long to respond.")
         st.info("This usually indicates the server is overloaded or not responding properly.")
@@ -488,56 +608,55 @@ def display_progress():
         st.error(f"⚠️ Unexpected error: {str(e)}")
         st.info("Please check if the backend server is running properly.")
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def _ai_assist(question, token):
+    """AI assist responses, cached so repeated questions skip the model"""
+    response = asyncio.run(_post_json(
+        API_ENDPOINTS["ai_assist"],
+        {"question": question},
+        {"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
+        timeout=60
+    ))
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
 def display_ai_assistance():
     st.header("🤖 AI Learning Assistant")
     
     if 'token' not in st.session_state or not st.session_state.token:
         st.error("Please login first")
         return
+
+    # Bail before a wasted round-trip if the token is already stale
+    if time.time() >= st.session_state.get("token_expires_at", 0):
+        st.error("Session expired. Please login again.")
+        st.session_state.token = None
+        st.rerun()
         
     with st.expander("Get Personalized Help"):
         user_question = st.text_area("Ask your DSA question:")
         if st.button("Get AI Help"):
             with st.spinner("Thinking..."):
                 try:
-                    # Show the API endpoint being used
-                    st.info(f"Using endpoint: {API_ENDPOINTS['ai_assist']}")
-                    
-                    # Increase timeout to 60 seconds
-                    response = requests.post(
-                        API_ENDPOINTS["ai_assist"],
-                        headers={
-                            "Authorization": f"Bearer {st.session_state.token}",
-                            "Content-Type": "application/json"
-                        },
-                        json={"question": user_question},
-                        timeout=60  # Increased timeout
-                    )
+                    dbg(f"Using endpoint: {API_ENDPOINTS['ai_assist']}")
                     
-                    # Debug information
-                    st.write(f"Response status code: {response.status_code}")
+                    # Cached per (question, token): repeats skip the LLM call
+                    ai_response = _ai_assist(user_question, st.session_state.token)
+                    st.markdown("### 💡 AI Response")
+                    st.markdown(ai_response.get('response', ''))
                     
-                    if response.status_code == 200:
-                        try:
-                            ai_response = response.json()
-                            st.markdown("### 💡 AI Response")
-                            st.markdown(ai_response.get('response', ''))
-                            
-                            if ai_response.get('code_example'):
-                                st.markdown("### 📝 Code Example")
-                                st.code(ai_response['code_example'], language='python')
-                        except json.JSONDecodeError:
-                            st.error("Invalid response format from server")
-                            st.write("Raw response:", response.text)
-                    else:
-                        try:
-                            error_data = response.json()
-                            error_msg = error_data.get("error", "Failed to get AI response")
-                            st.error(f"Error: {error_msg}")
-                        except json.JSONDecodeError:
-                            st.error(f"Error: {response.text}")
-                        
-                except requests.exceptions.Timeout:
+                    if ai_response.get('code_example'):
+                        st.markdown("### 📝 Code Example")
+                        st.code(ai_response['code_example'], language='python')
+                except httpx.HTTPStatusError as e:
+                    try:
+                        error_msg = e.response.json().get("error", "Failed to get AI response")
+                        st.error(f"Error: {error_msg}")
+                    except json.JSONDecodeError:
+                        st.error(f"Error: {e.response.text}")
+                except json.JSONDecodeError:
+                    st.error("Invalid response format from server")
+                except httpx.TimeoutException:
                     st.error("""
                     Request timed out. This might be because:
                     1. The AI model is taking longer than expected to respond
@@ -548,7 +667,7 @@ def display_ai_assistance():
                     2. Check your internet connection
                     3. Contact support if the issue continues
                     """)
-                except requests.exceptions.ConnectionError:
+                except httpx.ConnectError:
                     st.error("""
                     Cannot connect to server. Please check:
                     1. The backend server is running
@@ -564,21 +683,78 @@ def display_ai_assistance():
                     st.error(f"An error occurred: {str(e)}")
                     st.write("Full error details:", str(e))
 
+def _throttled(chunks, interval=0.1):
+    """Batch stream deltas so the page repaints at most every `interval`.
+
+    st.write_stream re-renders the whole markdown buffer per yielded
+    chunk, which is quadratic in response length if fed one token at a
+    time. Buffering tokens and releasing them every ~100 ms keeps the
+    repaint count constant per second regardless of token rate.
+    """
+    buffer = []
+    last_flush = time.monotonic()
+    for chunk in chunks:
+        buffer.append(chunk)
+        now = time.monotonic()
+        if now - last_flush > interval:
+            yield "".join(buffer)
+            buffer.clear()
+            last_flush = now
+    if buffer:
+        yield "".join(buffer)
+
+def _stream_markdown(chunks):
+    """Render a markdown stream as finalized blocks plus one live tail.
+
+    Re-rendering the whole growing answer per chunk makes the parse cost
+    quadratic in response length. Once a paragraph closes (a blank line
+    outside any code fence), it is written once into a stable container
+    and never parsed again; only the short unfinished tail gets redrawn.
+    Returns the full response text.
+    """
+    stable = st.container()
+    tail_slot = st.empty()
+    parts = []
+    tail = ""
+    for chunk in chunks:
+        tail += chunk
+        cut = tail.rfind("\n\n")
+        # An odd number of ``` markers before the cut means a code fence
+        # is still open there, so the block isn't really finished
+        if cut != -1 and tail[:cut].count("```") % 2 == 0:
+            block = tail[:cut]
+            tail = tail[cut + 2:]
+            parts.append(block)
+            stable.markdown(block)
+        tail_slot.markdown(tail)
+    if tail:
+        parts.append(tail)
+    return "\n\n".join(parts)
+
 def ai_chatbot():
     st.header("🤖 AI DSA Tutor")
     
     if 'token' not in st.session_state or not st.session_state.token:
         st.error("Please login first")
         return
+
+    # Bail before a wasted round-trip if the token is already stale
+    if time.time() >= st.session_state.get("token_expires_at", 0):
+        st.error("Session expired. Please login again.")
+        st.session_state.token = None
+        st.rerun()
     
     # Initialize chat history
     if "messages" not in st.session_state:
         st.session_state.messages = []
 
-    # Display chat history
-    for message in st.session_state.messages:
-        with st.chat_message(message["role"]):
-            st.markdown(message["content"])
+    # Display chat history as one markdown blob: a single frontend
+    # message per rerun instead of one per chat bubble
+    if st.session_state.messages:
+        st.markdown("\n\n".join(
+            f"**{'🧑 You' if message['role'] == 'user' else '🤖 Tutor'}:** {message['content']}"
+            for message in st.session_state.messages
+        ))
 
     # Chat input
     if prompt := st.chat_input("Ask me anything about Data Structures and Algorithms..."):
@@ -587,35 +763,51 @@ def ai_chatbot():
         with st.chat_message("user"):
             st.markdown(prompt)
 
-        # Show thinking message
+        # Stream the answer token by token
         with st.chat_message("assistant"):
-            with st.spinner("Thinking..."):
-                try:
-                    # Call backend API
-                    response = requests.post(
-                        f"{API_BASE_URL}/api/chat",
-                        headers={
-                            "Authorization": f"Bearer {st.session_state.token}",
-                            "Content-Type": "application/json"
-                        },
-                        json={"prompt": prompt},
-                        timeout=30
-                    )
-                    
-                    if response.status_code == 200:
-                        ai_response = response.json()["response"]
-                        st.session_state.messages.append({"role": "assistant", "content": ai_response})
-                        st.markdown(ai_response)
-                    else:
-                        error_msg = response.json().get("error", "Failed to get response")
-                        st.error(f"Error: {error_msg}")
-                        
-                except requests.exceptions.Timeout:
-                    st.error("Request timed out. Please try again.")
-                except requests.exceptions.ConnectionError:
-                    st.error("Cannot connect to server. Please check if the backend is running.")
-                except Exception as e:
-                    st.error(f"An error occurred: {str(e)}")
+            try:
+                # Cache key covers the prompt and all prior history, so
+                # only a truly repeated exchange skips the backend
+                history_hash = hashlib.blake2b(
+                    json.dumps(st.session_state.messages[:-1]).encode()
+                ).hexdigest()
+                chat_cache = st.session_state.setdefault("_chat_cache", {})
+                cached = chat_cache.get((prompt, history_hash))
+
+                if cached is not None:
+                    ai_response = cached
+                    st.markdown(ai_response)
+                else:
+                    with http().post(
+                        API_ENDPOINTS["chat"],
+                        headers=auth_headers(),
+                        json={"prompt": prompt, "stream": True},
+                        stream=True,
+                        timeout=60
+                    ) as response:
+                        if response.status_code == 200:
+                            # Render from the first token instead of waiting
+                            # for the full generation; finalized blocks are
+                            # parsed once, only the tail is redrawn
+                            ai_response = _stream_markdown(_throttled(
+                                json.loads(line[len("data: "):])
+                                for line in response.iter_lines(decode_unicode=True)
+                                if line and line.startswith("data: ")
+                            ))
+                            chat_cache[(prompt, history_hash)] = ai_response
+                        else:
+                            error_msg = response.json().get("error", "Failed to get response")
+                            st.error(f"Error: {error_msg}")
+                            ai_response = None
+
+                if ai_response is not None:
+                    st.session_state.messages.append({"role": "assistant", "content": ai_response})
+            except requests.exceptions.Timeout:
+                st.error("Request timed out. Please try again.")
+            except requests.exceptions.ConnectionError:
+                st.error("Cannot connect to server. Please check if the backend is running.")
+            except Exception as e:
+                st.error(f"An error occurred: {str(e)}")
                     
     # Add a clear chat button in the sidebar
     with st.sidebar:
@@ -623,13 +815,64 @@ def ai_chatbot():
             st.session_state.messages = []
             st.rerun()
 
-def main():
-    # Initialize session state
-    init_session_state()
-    
-    # Custom CSS for a more technical look
-    st.markdown("""
-        <style>
+# Static HTML blocks, built once at import so reruns just pass references
+_HEADER_TEMPLATE = """
+            <div class="header-container">
+                <div class="title-section">
+                    <div class="logo-container">
+                        <div class="logo-icon">👽</div>
+                        <div>
+                            <div class="logo-text">DSA Tutor Pro</div>
+                            <div class="logo-subtitle">Master Data Structures & Algorithms</div>
+                        </div>
+                    </div>
+                </div>
+                <div class="quote-container">
+                    <div class="quote-header">
+                        <span class="tech-icon">⚡</span>Code of the Day
+                    </div>
+                    <div class="quote-text">
+                        "{quote}"
+                    </div>
+                    <div class="quote-author">
+                        - {author}
+                    </div>
+                </div>
+            </div>
+"""
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def _quote_of_day():
+    """Today's quote as (text, author); swap in an API fetch to rotate"""
+    return "First, solve the problem. Then, write the code.", "John Johnson"
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def _header_html():
+    """Header block with the quote formatted in, rebuilt once per day"""
+    quote, author = _quote_of_day()
+    return _HEADER_TEMPLATE.format(quote=quote, author=author)
+
+_SIDEBAR_LOGO_HTML = """
+    <div style='text-align: center; margin-bottom: 2rem;'>
+        <div class="logo-text" style='font-size: 2rem;'><span class="sidebar-logo">👽</span> DSA Pro</div>
+    </div>
+"""
+
+# One element for the whole logo block: the .logo-container flex rules
+# handle the layout the old column split used to provide
+_LOGIN_HEADER_HTML = """
+    <div class="logo-container">
+        <div class="logo-icon">👽</div>
+        <div>
+            <div class="logo-text">DSA Tutor Pro</div>
+            <div class="logo-subtitle">Master Data Structures & Algorithms</div>
+        </div>
+    </div>
+"""
+
+# Rules both branches need: widgets and the animated logo text shared by
+# the login header and the sidebar
+_BASE_CSS = """
         .main {
             background-color: #0E1117;
         }
@@ -643,19 +886,92 @@ def main():
             transform: translateY(-2px);
             background-color: #2C5282;
         }
-        
+
         /* Animated logo */
         @keyframes fadeIn {
             from { opacity: 0; transform: translateY(-20px); }
             to { opacity: 1; transform: translateY(0); }
         }
-        
+
         @keyframes float {
             0% { transform: translateY(0px); }
             50% { transform: translateY(-5px); }
             100% { transform: translateY(0px); }
         }
-        
+
+        .logo-text {
+            font-weight: 900;
+            color: #FFFFFF;
+            font-size: 3rem;
+            margin-bottom: 1rem;
+            letter-spacing: -1px;
+            margin-left: 0.7rem;
+            animation: fadeIn 0.8s ease-out;
+        }
+
+        /* Tab animations */
+        .stTabs {
+            transition: opacity 0.3s ease;
+        }
+
+        .stTab {
+            transition: all 0.3s ease;
+        }
+
+        .stTab:hover {
+            transform: translateY(-2px);
+        }
+
+        /* Search bar animation. Only transform/opacity transition (they
+           run on the compositor thread); the focus glow is a pre-rendered
+           shadow on a pseudo-element faded in with opacity, because
+           animating box-shadow repaints the whole rect per frame */
+        .stTextInput {
+            position: relative;
+        }
+
+        .stTextInput::after {
+            content: "";
+            position: absolute;
+            inset: 0;
+            border-radius: 5px;
+            box-shadow: 0 0 15px rgba(59, 113, 202, 0.2);
+            opacity: 0;
+            transition: opacity 0.3s ease;
+            pointer-events: none;
+        }
+
+        .stTextInput:focus-within::after {
+            opacity: 1;
+        }
+
+        .stTextInput input {
+            border: 1px solid #3B71CA;
+            border-radius: 5px;
+            transition: transform 0.3s ease;
+        }
+
+        .stTextInput input:focus {
+            transform: scale(1.01);
+        }
+
+        /* Success message animation */
+        @keyframes pulseSuccess {
+            0% { transform: scale(1); }
+            50% { transform: scale(1.02); }
+            100% { transform: scale(1); }
+        }
+
+        .success {
+            padding: 1rem;
+            border-radius: 5px;
+            background-color: #1E2749;
+            animation: pulseSuccess 2s infinite;
+        }
+"""
+
+# Login page only: the big animated logo block
+_LOGIN_CSS = """
         .logo-container {
             display: flex;
             align-items: center;
@@ -664,127 +980,134 @@ def main():
             margin-bottom: 0;
             animation: fadeIn 0.8s ease-out;
         }
-        
+
         .logo-icon {
             font-size: 4.5rem;
             margin-right: -0.8rem;
             margin-left: -0.5rem;
             animation: float 3s ease-in-out infinite;
         }
-        
-        .logo-text {
-            font-weight: 900;
-            color: #FFFFFF;
-            font-size: 3rem;
-            margin-bottom: 1rem;
-            letter-spacing: -1px;
-            margin-left: 0.7rem;
-            animation: fadeIn 0.8s ease-out;
+
+        /* Logo subtitle animation; will-change pre-promotes the layer so
+           the entry fade composites instead of repainting the header */
+        .logo-subtitle {
+            color: #6C757D;
+            font-size: 1rem;
+            margin-top: -1rem;
+            margin-bottom: 2rem;
+            animation: fadeIn 1s ease-out 0.3s backwards;
+            will-change: transform, opacity;
         }
-        
+"""
+
+# Logged-in app only: header/quote layout, sidebar, cards and metrics
+_APP_CSS = """
         /* Animated cards */
         @keyframes slideIn {
             from { opacity: 0; transform: translateX(-20px); }
             to { opacity: 1; transform: translateX(0); }
         }
-        
+
         .stExpander {
+            position: relative;
             border: 1px solid #2E3440;
             border-radius: 8px;
             margin-bottom: 10px;
             animation: slideIn 0.5s ease-out;
-            transition: transform 0.2s ease, box-shadow 0.2s ease;
+            transition: transform 0.2s ease;
         }
-        
+
+        .stExpander::after {
+            content: "";
+            position: absolute;
+            inset: 0;
+            border-radius: 8px;
+            box-shadow: 0 4px 12px rgba(0,0,0,0.1);
+            opacity: 0;
+            transition: opacity 0.2s ease;
+            pointer-events: none;
+        }
+
         .stExpander:hover {
             transform: translateX(5px);
-            box-shadow: 0 4px 12px rgba(0,0,0,0.1);
         }
-        
+
+        .stExpander:hover::after {
+            opacity: 1;
+        }
+
         /* Progress bar animation */
         @keyframes progressFill {
             from { width: 0; }
             to { width: 100%; }
         }
-        
-        /* Success message animation */
-        @keyframes pulseSuccess {
-            0% { transform: scale(1); }
-            50% { transform: scale(1.02); }
-            100% { transform: scale(1); }
-        }
-        
-        .success {
-            padding: 1rem;
-            border-radius: 5px;
-            background-color: #1E2749;
-            animation: pulseSuccess 2s infinite;
-        }
-        
+
         /* Metric animations */
         .stMetric {
             transition: transform 0.3s ease;
         }
-        
+
         .stMetric:hover {
             transform: scale(1.05);
         }
-        
-        /* Tab animations */
-        .stTabs {
-            transition: opacity 0.3s ease;
-        }
-        
-        .stTab {
-            transition: all 0.3s ease;
-        }
-        
-        .stTab:hover {
-            transform: translateY(-2px);
-        }
-        
-        /* Search bar animation */
-        .stTextInput input {
-            border: 1px solid #3B71CA;
-            border-radius: 5px;
-            transition: all 0.3s ease;
-        }
-        
-        .stTextInput input:focus {
-            transform: scale(1.01);
-            box-shadow: 0 0 15px rgba(59, 113, 202, 0.2);
-        }
-        
-        /* Category tag animation */
+
+        /* Category tag animation; hover shadow uses the same
+           opacity-toggled pseudo-element trick as the text input */
         .category-tag {
+            position: relative;
             background-color: #1E2749;
             padding: 0.2rem 0.6rem;
             border-radius: 15px;
             font-size: 0.8rem;
             color: #3B71CA;
-            transition: all 0.3s ease;
+            transition: transform 0.3s ease;
+            will-change: transform;
+            contain: layout paint style;
         }
-        
+
+        .category-tag::after {
+            content: "";
+            position: absolute;
+            inset: 0;
+            border-radius: 15px;
+            box-shadow: 0 4px 12px rgba(0,0,0,0.1);
+            opacity: 0;
+            transition: opacity 0.3s ease;
+            pointer-events: none;
+        }
+
         .category-tag:hover {
             transform: translateY(-2px);
-            box-shadow: 0 4px 12px rgba(0,0,0,0.1);
         }
-        
-        /* Logo subtitle animation */
-        .logo-subtitle {
-            color: #6C757D;
-            font-size: 1rem;
-            margin-top: -1rem;
-            margin-bottom: 2rem;
-            animation: fadeIn 1s ease-out 0.3s backwards;
+
+        .category-tag:hover::after {
+            opacity: 1;
         }
-        
+
         /* Sidebar logo */
         .sidebar-logo {
             font-size: 3rem;
             margin-right: 0rem;
         }
-        
+
+        /* Sidebar quick stats: flex row replacing a column/metric pair */
+        .quick-stats {
+            display: flex;
+            gap: 1rem;
+        }
+
+        .quick-stats > div {
+            flex: 1;
+            color: #6C757D;
+            font-size: 0.9rem;
+        }
+
+        .quick-stats b {
+            color: #FFFFFF;
+            font-size: 1.6rem;
+            font-weight: 700;
+        }
+
         .header-container {
             display: flex;
             justify-content: space-between;
@@ -793,12 +1116,20 @@ def main():
             margin-bottom: 2rem;
             width: 100%;
         }
-        
+
         .title-section {
             flex: 0 0 auto;
             margin-right: auto;
         }
-        
+
+        /* The glow pulse lives on a ::before that only animates opacity,
+           and containment keeps its repaints inside the card instead of
+           invalidating the surrounding header layout */
+        @keyframes glow {
+            from { opacity: 0.2; }
+            to { opacity: 1; }
+        }
+
         .quote-container {
             flex: 0 0 50%;
             background: linear-gradient(135deg, rgba(30, 39, 73, 0.6), rgba(44, 62, 80, 0.6));
@@ -807,104 +1138,150 @@ def main():
             padding: 15px 20px;
             position: relative;
             overflow: hidden;
-            box-shadow: 0 0 20px rgba(59, 113, 202, 0.1);
-            animation: glow 3s infinite alternate;
             margin-top: 10px;
             margin-right: 20px;
+            contain: layout paint style;
         }
-        </style>
-    """, unsafe_allow_html=True)
 
-    if st.session_state.token is None:
-        # Logo and Title for login page
-        col1, col2 = st.columns([0.25, 5])
-        with col1:
-            st.markdown('<div class="logo-icon">👽</div>', unsafe_allow_html=True)
-        with col2:
-            st.markdown('<div class="logo-text">DSA Tutor Pro</div>', unsafe_allow_html=True)
-            st.markdown('<div class="logo-subtitle">Master Data Structures & Algorithms</div>', unsafe_allow_html=True)
-
-        # Login page content
-        col1, col2 = st.columns([1, 1])
-        with col1:
-            with st.container():
-                st.markdown("""
-                    ### 🚀 Welcome to DSA Tutor Pro
-                    Your personal guide to mastering algorithms
-                    
-                    - 📚 Curated DSA content
-                    - 💡 Interactive learning
-                    - 📊 Progress tracking
-                    - 🤖 AI-powered assistance
-                    - ⚡ Real-time feedback
-                    - 🎯 Targeted practice
-                """)
-        with col2:
-            tab1, tab2 = st.tabs(["🔑 Login", "📝 Sign Up"])
-            with tab1:
-                login()
-            with tab2:
-                signup()
-    else:
-        # Combined header with logo and quote
-        st.markdown("""
-            <div class="header-container">
-                <div class="title-section">
-                    <div class="logo-container">
-                        <div class="logo-icon">👽</div>
-                        <div>
-                            <div class="logo-text">DSA Tutor Pro</div>
-                            <div class="logo-subtitle">Master Data Structures & Algorithms</div>
-                        </div>
-                    </div>
-                </div>
-                <div class="quote-container">
-                    <div class="quote-header">
-                        <span class="tech-icon">⚡</span>Code of the Day
-                    </div>
-                    <div class="quote-text">
-                        "First, solve the problem. Then, write the code."
-                    </div>
-                    <div class="quote-author">
-                        - John Johnson
-                    </div>
-                </div>
-            </div>
-        """, unsafe_allow_html=True)
+        .quote-container::before {
+            content: "";
+            position: absolute;
+            inset: 0;
+            border-radius: 15px;
+            box-shadow: 0 0 20px rgba(59, 113, 202, 0.1) inset;
+            animation: glow 3s infinite alternate;
+            will-change: opacity;
+            pointer-events: none;
+        }
+"""
+
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CSS_SEP_RE = re.compile(r"\s*([{};:,])\s*")
+
+def _minify_css(css):
+    """Strip comments and collapse whitespace; good enough for our rules
+    and avoids pulling in a minifier dependency"""
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = " ".join(css.split())
+    return _CSS_SEP_RE.sub(r"\1", css).strip()
+
+_STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+
+@st.cache_resource
+def _css(branch):
+    """Link tag for one branch's stylesheet ('login' or 'app').
+
+    The minified rules are written once per process to frontend/static/
+    (guarded, so an unchanged blob never rewrites the file) and served by
+    Streamlit's static route: the browser caches the file across sessions
+    and the per-rerun payload shrinks to this one link tag. The digest
+    query param busts that cache whenever the rules change.
+    """
+    css = _minify_css(_BASE_CSS + (_LOGIN_CSS if branch == "login" else _APP_CSS))
+    encoded = css.encode()
+    digest = hashlib.blake2b(encoded, digest_size=8).hexdigest()
+    path = os.path.join(_STATIC_DIR, f"{branch}.css")
+    os.makedirs(_STATIC_DIR, exist_ok=True)
+    try:
+        with open(path, "rb") as f:
+            unchanged = f.read() == encoded
+    except OSError:
+        unchanged = False
+    if not unchanged:
+        with open(path, "wb") as f:
+            f.write(encoded)
+    return f'<link rel="stylesheet" href="./app/static/{branch}.css?v={digest}">'
+
+def _render_login():
+    # Logo and Title for login page, shipped as a single element
+    st.markdown(_LOGIN_HEADER_HTML, unsafe_allow_html=True)
 
-        # Sidebar with user info and stats
-        with st.sidebar:
+    # Login page content
+    col1, col2 = st.columns([1, 1])
+    with col1:
+        with st.container():
             st.markdown("""
-                <div style='text-align: center; margin-bottom: 2rem;'>
-                    <div class="logo-text" style='font-size: 2rem;'><span class="sidebar-logo">👽</span> DSA Pro</div>
-                </div>
-            """, unsafe_allow_html=True)
-            
-            st.markdown("### 👤 User Dashboard")
-            st.success("🟢 Logged in successfully!")
-            
-            # Add quick stats in sidebar
-            st.markdown("### 📊 Quick Stats")
-            col1, col2 = st.columns(2)
-            with col1:
-                st.metric("Questions", len(st.session_state.completed_questions))
-            with col2:
-                progress_percent = len(st.session_state.completed_questions) * 100 / 50  # Assuming 50 total questions
-                st.metric("Progress", f"{progress_percent:.1f}%")
-            
-            if st.button("🚪 Logout", type="primary"):
-                for key in st.session_state.keys():
-                    del st.session_state[key]
-                st.rerun()
+                ### 🚀 Welcome to DSA Tutor Pro
+                Your personal guide to mastering algorithms
 
-        # Main content area
-        tab1, tab2, tab3 = st.tabs(["📚 Learning Hub", "📈 Progress Analytics", "🤖 AI Assistant"])
+                - 📚 Curated DSA content
+                - 💡 Interactive learning
+                - 📊 Progress tracking
+                - 🤖 AI-powered assistance
+                - ⚡ Real-time feedback
+                - 🎯 Targeted practice
+            """)
+    with col2:
+        tab1, tab2 = st.tabs(["🔑 Login", "📝 Sign Up"])
         with tab1:
-            display_articles()
+            login()
         with tab2:
-            display_progress()
-        with tab3:
-            display_ai_assistance()
+            signup()
+
+def _logout():
+    # Debounce: a double-click queues two callbacks, and the timestamp
+    # makes the second a no-op. Written after clear() so the wipe can't
+    # erase the guard, and stale enough after a second that a genuine
+    # later logout still works
+    if time.time() - st.session_state.get("_logged_out_at", 0) < 1:
+        return
+    st.session_state.clear()
+    st.session_state["_logged_out_at"] = time.time()
+
+def _render_app():
+    # Combined header with logo and quote
+    st.markdown(_header_html(), unsafe_allow_html=True)
+
+    # Sidebar with user info and stats
+    with st.sidebar:
+        st.markdown(_SIDEBAR_LOGO_HTML, unsafe_allow_html=True)
+
+        st.markdown("### 👤 User Dashboard")
+        st.success("🟢 Logged in successfully!")
+
+        # Add quick stats in sidebar: one flex element instead of a
+        # two-column split holding two metric widgets
+        st.markdown("### 📊 Quick Stats")
+        completed_count = len(st.session_state.completed_questions)  # O(1): bitset tracks its popcount
+        progress_percent = completed_count * _INV_TOTAL_PCT
+        st.markdown(
+            '<div class="quick-stats">'
+            f'<div>Questions<br><b>{completed_count}</b></div>'
+            f'<div>Progress<br><b>{progress_percent:.1f}%</b></div>'
+            '</div>',
+            unsafe_allow_html=True
+        )
+
+        # As an on_click callback the clear runs before the natural rerun,
+        # so logout costs one script execution instead of two
+        st.button("🚪 Logout", type="primary", on_click=_logout)
+
+    # Main content area: fetch both dashboard payloads concurrently,
+    # then hand the tabs pre-loaded data
+    articles, progress = _dashboard_data(st.session_state.token)
+    tab1, tab2, tab3, tab4 = st.tabs(["📚 Learning Hub", "📈 Progress Analytics", "🤖 AI Assistant", "💬 AI Tutor"])
+    with tab1:
+        display_articles(articles)
+    with tab2:
+        display_progress(progress)
+    with tab3:
+        display_ai_assistance()
+    with tab4:
+        ai_chatbot()
+
+def main():
+    # Initialize session state
+    init_session_state()
+
+    # Each branch ships only the styles it uses. The link tag must still
+    # go out on every rerun or Streamlit drops it from the page, but the
+    # stylesheet itself now comes from the browser's HTTP cache
+    if st.session_state.token is None:
+        st.markdown(_css("login"), unsafe_allow_html=True)
+        _render_login()
+    else:
+        st.markdown(_css("app"), unsafe_allow_html=True)
+        _render_app()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,12 @@
+# Gunicorn production config.
+# Every route is network-bound on Supabase/OpenAI calls, so gevent
+# workers let hundreds of in-flight requests overlap their I/O waits
+# instead of blocking one sync worker per request. Combined with the
+# keep-alive pool in app/__init__.py, each greenlet borrows a warm
+# connection rather than handshaking.
+#
+# Run with: gunicorn -c gunicorn.conf.py "app:create_app()"
+bind = "0.0.0.0:5000"
+worker_class = "gevent"
+workers = 4
+worker_connections = 1000
@@ -1,9 +1,22 @@
 import streamlit as st
 import requests
+import concurrent.futures
+import functools
 import json
-from PIL import Image
 import os
-from dotenv import load_dotenv
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:  # keep working if the optional speedup is absent
+    orjson = None
+
+def _loads(response):
+    """Decode a JSON response with orjson when available (~2-5x faster
+    on the articles list), falling back to requests' stdlib parser"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
 
 # Configure page with dark theme and wide layout
 st.set_page_config(
@@ -13,59 +26,132 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-load_dotenv()
+# .env is only needed when the environment isn't already configured,
+# so the dotenv import stays off the cold-start path otherwise
+if os.getenv("SUPABASE_KEY") is None:
+    from dotenv import load_dotenv
+    load_dotenv()
+
+# One pooled session for every backend call: keep-alive connections skip
+# the per-request TCP handshake that a bare requests.get/post pays
+SESSION = requests.Session()
+SESSION.mount("http://", requests.adapters.HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=requests.adapters.Retry(
+        total=2,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset(["GET", "POST"])
+    )
+))
 
-# Try multiple possible API endpoints to find the working one
+# Split connect/read timeouts: a dead backend fails the connect in ~1.5s
+# instead of eating the whole read budget
+CONNECT_TIMEOUT = 1.5
+
+# Try multiple possible API endpoints to find the working one.
+# Cached per process: without this the probing (up to 3 URLs x 2s
+# timeout) re-ran on every widget interaction, since Streamlit
+# re-executes the whole script per rerun. No st.* output inside —
+# elements from a cached function don't render reliably.
+@st.cache_resource(show_spinner=False)
 def get_working_api_url():
-    possible_urls = [
-        "http://127.0.0.1:8000",
-        "http://localhost:8000",
-        "http://192.168.185.243:8000"  # IP address from the running server
-    ]
-    
-    st.write("🔍 Checking available backend servers...")
-    
-    for url in possible_urls:
-        try:
-            st.write(f"Trying to connect to: {url}")
-            response = requests.get(f"{url}/", timeout=2)
-            if response.status_code == 200:
-                st.success(f"✅ Found working backend at: {url}")
+    # Connect budgets scaled to the hop: loopback answers in
+    # microseconds or never, the LAN host deserves a little patience.
+    # url -> connect timeout; the running server's LAN IP comes last
+    possible_urls = {
+        "http://127.0.0.1:8000": 0.2,
+        "http://localhost:8000": 0.2,
+        "http://192.168.185.243:8000": 1.0,
+    }
+
+    def probe(url, connect_timeout):
+        # HEAD is enough to prove liveness and transfers no body; one
+        # quick retry at double the budget covers a slow first answer
+        for attempt_timeout in (connect_timeout, connect_timeout * 2):
+            try:
+                response = SESSION.head(f"{url}/", timeout=(attempt_timeout, 0.5))
+                response.raise_for_status()
                 return url
-        except requests.exceptions.ConnectionError:
-            st.warning(f"❌ Could not connect to: {url}")
-        except Exception as e:
-            st.warning(f"❌ Error connecting to {url}: {str(e)}")
-    
-    st.error("❌ No working backend server found!")
-    st.info("""
-    To fix this:
-    1. Make sure the backend server is running
-    2. Open a new terminal
-    3. Navigate to the backend directory:
-       ```
-       cd app/backend
-       ```
-    4. Start the Flask server:
-       ```
-       python app.py
-       ```
-    5. You should see: "Running on http://0.0.0.0:8000"
-    """)
-    
+            except Exception:
+                continue
+        raise ConnectionError(url)
+
+    # Probe everything at once and take the first responder, so one dead
+    # candidate costs max(timeouts) instead of stacking serially
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(possible_urls)) as executor:
+        futures = [
+            executor.submit(probe, url, connect_timeout)
+            for url, connect_timeout in possible_urls.items()
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                return future.result()
+            except Exception:
+                continue
+
     # Default fallback
     return "http://127.0.0.1:8000"
 
 API_BASE_URL = get_working_api_url()  # Dynamically find working URL
 SUPABASE_KEY = os.getenv("SUPABASE_KEY")  # Make sure this is set in your .env file
 
+# Debug output is opt-in: every st.write/expander costs a websocket
+# message and DOM nodes per rerun, and the login dump leaks details
+DEBUG = bool(os.getenv("DSA_DEBUG"))
+
+# Static copy blocks, frozen at import so reruns reuse the same objects
+_BACKEND_FIX_HINT = """
+# 1. Open a new terminal
+# 2. Navigate to your backend directory
+cd app/backend
+
+# 3. Start the Flask server
+python app.py
+
+# 4. You should see: "Running on http://0.0.0.0:8000"
+"""
+
+_CONNECT_CHECKLIST = """
+Please check:
+1. The backend server is running
+2. There are no firewall/network issues
+3. The API URL is correct
+"""
+
+_WELCOME_MD = """
+### 🚀 Welcome to DSA Tutor Pro
+Your personal guide to mastering algorithms
+
+- 📚 Curated DSA content
+- 💡 Interactive learning
+- 📊 Progress tracking
+- 🤖 AI-powered assistance
+- ⚡ Real-time feedback
+- 🎯 Targeted practice
+"""
+
 def init_session_state():
     if 'token' not in st.session_state:
         st.session_state.token = None
     if 'user_role' not in st.session_state:
         st.session_state.user_role = None
     if 'completed_questions' not in st.session_state:
-        st.session_state.completed_questions = set()
+        # Int bitset (bit i = problem i solved): one word in session
+        # state instead of a set of boxed ints, counted via POPCNT
+        st.session_state.completed_questions = 0
+
+def mark_solved(i):
+    st.session_state.completed_questions |= 1 << i
+
+def solved_count():
+    return st.session_state.completed_questions.bit_count()
+
+def completion_pct():
+    # 100 / 50 problems = 2.0 per solve; one definition keeps the
+    # sidebar and analytics tab in sync
+    return st.session_state.completed_questions.bit_count() * 2.0
 
 def signup():
     st.subheader("Sign Up")
@@ -92,7 +178,7 @@ def signup():
                 data["admin_code"] = admin_code
 
             try:
-                response = requests.post(
+                response = SESSION.post(
                     f"{API_BASE_URL}/users/signup",
                     headers={"Content-Type": "application/json"},
                     json=data
@@ -117,8 +203,9 @@ def login():
     st.subheader("Login")
     
     # Show the current API URL being used
-    st.info(f"API URL: {API_BASE_URL}")
-    
+    if DEBUG:
+        st.info(f"API URL: {API_BASE_URL}")
+
     with st.form("login_form"):
         email = st.text_input("Email")
         password = st.text_input("Password", type="password")
@@ -133,55 +220,36 @@ def login():
             url = f"{API_BASE_URL}/users/login"
             
             # Create an expander for debugging information
-            with st.expander("🛠️ Debug Information", expanded=False):
-                st.write("Login URL:", url)
-                st.write("Email:", email)
-                st.write("Password:", "*" * len(password))
+            if DEBUG:
+                with st.expander("🛠️ Debug Information", expanded=False):
+                    st.write("Login URL:", url)
+                    st.write("Email:", email)
+                    st.write("Password:", "*" * len(password))
             
             try:
-                # Check server health first
-                try:
-                    health_check_url = f"{API_BASE_URL}/"
-                    st.write(f"Checking server health at: {health_check_url}")
-                    health_response = requests.get(health_check_url, timeout=5)
-                    st.success(f"✅ Server is running. Status: {health_response.status_code}")
-                except requests.exceptions.ConnectionError:
-                    st.error("❌ Backend server is not running!")
-                    st.info("To fix this:")
-                    st.code("""
-                    # 1. Open a new terminal
-                    # 2. Navigate to your backend directory
-                    cd app/backend
-                    
-                    # 3. Start the Flask server
-                    python app.py
-                    
-                    # 4. You should see: "Running on http://0.0.0.0:8000"
-                    """)
-                    return
-                except Exception as e:
-                    st.error(f"❌ Server health check error: {str(e)}")
-                    return
-                
-                # Proceed with login
-                st.write(f"Attempting to login at: {url}")
+                # No pre-flight health check: a dead backend surfaces as
+                # ConnectionError on the real request below, with the
+                # same fix-it messaging and one fewer round trip
+                if DEBUG:
+                    st.write(f"Attempting to login at: {url}")
                 
-                response = requests.post(
+                response = SESSION.post(
                     url,
                     headers={"Content-Type": "application/json"},
                     json={"email": email, "password": password},
-                    timeout=10
+                    timeout=(CONNECT_TIMEOUT, 10)
                 )
                 
                 # Display response details
-                st.write(f"Response status code: {response.status_code}")
+                if DEBUG:
+                    st.write(f"Response status code: {response.status_code}")
                 
                 if response.status_code == 200:
                     data = response.json()
                     st.session_state.token = data.get("token", "default_token")
                     st.session_state.user_role = data.get("role", "user")
                     st.success("✅ Login successful!")
-                    st.experimental_rerun()
+                    st.rerun()
                 elif response.status_code == 401:
                     st.error("❌ Invalid credentials. Please check your email and password.")
                     # Show test credentials as a hint
@@ -195,22 +263,63 @@ def login():
             except requests.exceptions.ConnectionError:
                 st.error("⚠️ Connection error. Backend server is not running.")
                 st.info("To fix this:")
-                st.code("""
-                # 1. Open a new terminal
-                # 2. Navigate to your backend directory
-                cd app/backend
-                
-                # 3. Start the Flask server
-                python app.py
-                
-                # 4. You should see: "Running on http://0.0.0.0:8000"
-                """)
+                st.code(_BACKEND_FIX_HINT)
             except requests.exceptions.Timeout:
                 st.error("⚠️ Request timed out. The server took too long to respond.")
             except Exception as e:
                 st.error(f"⚠️ Error: {str(e)}")
                 st.info("Please check if the backend server is running properly.")
 
+@functools.lru_cache(maxsize=4)
+def _auth_headers(token):
+    """Per-token header dict, built once and shared by every call.
+
+    SESSION is process-wide across all Streamlit sessions, so stashing
+    Authorization as a session default would leak one user's token into
+    another's requests — the memo gives the same allocation saving
+    without that hazard.
+    """
+    return {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_articles(token):
+    """Articles payload, cached per token so tab reopens hit RAM"""
+    response = SESSION.get(
+        f"{API_BASE_URL}/users/articles",
+        headers=_auth_headers(token),
+        timeout=(CONNECT_TIMEOUT, 10)
+    )
+    response.raise_for_status()
+    return _loads(response)
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_progress(token):
+    """Progress payload, cached per token like the articles list"""
+    response = SESSION.get(
+        f"{API_BASE_URL}/users/user/progress",
+        headers=dict(_auth_headers(token), apikey=SUPABASE_KEY),
+        timeout=(CONNECT_TIMEOUT, 10)
+    )
+    response.raise_for_status()
+    return _loads(response)
+
+def _prefetch(token):
+    """Warm both dashboard payload caches in parallel, so first load
+    costs the slower of the two round trips instead of their sum"""
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        articles = executor.submit(_fetch_articles, token)
+        progress = executor.submit(_fetch_progress, token)
+        try:
+            articles.result()
+            progress.result()
+        except Exception:
+            # Each tab reports its own fetch failures with full context;
+            # prefetching is purely an optimization
+            pass
+
+# Fragments: interactions inside one tab re-run only that tab's body
+# instead of the whole script (and the other tabs' fetches)
+@st.fragment
 def display_articles():
     st.header("Learning Resources")
     
@@ -219,97 +328,69 @@ def display_articles():
         return
     
     # Show the current API URL being used
-    st.info(f"API URL: {API_BASE_URL}")
-    
+    if DEBUG:
+        st.info(f"API URL: {API_BASE_URL}")
+
     # Debug: Display token information for troubleshooting
-    if st.session_state.token:
+    if DEBUG and st.session_state.token:
         token_preview = st.session_state.token[:10] + "..." if len(st.session_state.token) > 10 else st.session_state.token
         st.write(f"Debug - Using token: {token_preview}")
-        
-    headers = {
-        "Authorization": f"Bearer {st.session_state.token}",
-        "Content-Type": "application/json"
-    }
-    
-    # Create an expander for debugging information
-    with st.expander("🛠️ Debug Information"):
-        st.write("Headers:", headers)
-        st.write("API URL:", API_BASE_URL)
-        st.write("Endpoint:", f"{API_BASE_URL}/users/articles")
+        with st.expander("🛠️ Debug Information"):
+            st.write("API URL:", API_BASE_URL)
+            st.write("Endpoint:", f"{API_BASE_URL}/users/articles")
     
     try:
-        # First, check if the server is running with a health check
-        try:
-            health_check_url = f"{API_BASE_URL}/"
-            st.write(f"Checking server health at: {health_check_url}")
-            health_response = requests.get(health_check_url, timeout=5)
-            st.success(f"✅ Server is running. Status: {health_response.status_code}")
-        except requests.exceptions.ConnectionError:
-            st.error("❌ Cannot connect to the server. Please ensure the backend is running.")
-            st.code("""
-            # Run this command in a new terminal:
-            cd app/backend
-            python app.py
-            """)
-            return
-        except Exception as e:
-            st.error(f"❌ Server health check error: {str(e)}")
-            return
-        
-        # Now fetch the articles
-        url = f"{API_BASE_URL}/users/articles"
-        st.write(f"Fetching articles from: {url}")
-        
-        response = requests.get(
-            url,
-            headers=headers,
-            timeout=10
-        )
-        
-        st.write(f"Response status code: {response.status_code}")
-        
-        if response.status_code == 200:
-            try:
-                articles = response.json()
-                st.success(f"✅ Successfully retrieved {len(articles)} articles")
-                
-                if not articles:
-                    st.info("No articles available yet.")
-                else:
-                    for article in articles:
-                        with st.expander(f"📚 {article.get('title', 'Untitled')}"):
-                            st.markdown(article.get('content', 'No content available'))
-            except ValueError:
-                st.error("Invalid response format from server")
-                st.write("Response content:", response.text[:200] + "..." if len(response.text) > 200 else response.text)
-        elif response.status_code == 401:
+        # Served from the per-token cache between reruns; the
+        # ConnectionError handler below already covers a dead backend
+        articles = _fetch_articles(st.session_state.token)
+        st.success(f"✅ Successfully retrieved {len(articles)} articles")
+
+        if not articles:
+            st.info("No articles available yet.")
+        else:
+            for article in articles:
+                with st.expander(f"📚 {article.get('title', 'Untitled')}"):
+                    st.markdown(article.get('content', 'No content available'))
+
+    except requests.exceptions.HTTPError as e:
+        if e.response is not None and e.response.status_code == 401:
             st.error("Session expired or invalid token. Please login again.")
             st.session_state.token = None
-            st.experimental_rerun()
+            st.rerun()
         else:
-            st.error(f"Error fetching articles. Status code: {response.status_code}")
-            st.write("Response content:", response.text)
-            
+            st.error(f"Error fetching articles. Status code: {e.response.status_code}")
+            st.write("Response content:", e.response.text)
+    except ValueError:
+        st.error("Invalid response format from server")
     except requests.exceptions.Timeout:
         st.error("⚠️ Request timed out. The server took too long to respond.")
         st.info("This usually indicates the server is overloaded or not responding properly.")
     except requests.exceptions.ConnectionError:
         st.error("⚠️ Unable to connect to the server.")
-        st.info("""
-        Please check:
-        1. The backend server is running
-        2. There are no firewall/network issues
-        3. The API URL is correct
-        """)
-        st.code("""
-        # Start the backend server:
-        cd app/backend
-        python app.py
-        """)
+        st.info(_CONNECT_CHECKLIST)
+        st.code(_BACKEND_FIX_HINT)
     except Exception as e:
         st.error(f"⚠️ Unexpected error: {str(e)}")
         st.info("Please check if the backend server is running properly.")
 
+@st.cache_data(show_spinner=False)
+def _perf_trends_df():
+    """Mock trend data as a ready DataFrame, so reruns skip the
+    dict -> DataFrame -> Arrow coercion inside st.line_chart"""
+    return pd.DataFrame(
+        {"Problems Solved": [5, 8, 12, 15], "Avg Time (min)": [45, 40, 35, 30]},
+        index=["W1", "W2", "W3", "W4"],
+    )
+
+@st.cache_data(show_spinner=False)
+def _difficulty_df():
+    """Mock success rates as one cached frame for a single bar chart"""
+    return pd.DataFrame(
+        {"Success Rate (%)": [60, 35, 20]},
+        index=["Easy", "Medium", "Hard"],
+    )
+
+@st.fragment
 def display_progress():
     st.header("📊 Learning Analytics")
     
@@ -317,122 +398,104 @@ def display_progress():
         st.error("Please login first")
         return
         
-    headers = {
-        "Authorization": f"Bearer {st.session_state.token}",
-        "apikey": SUPABASE_KEY,
-        "Content-Type": "application/json"
-    }
-    
     try:
-        response = requests.get(
-            f"{API_BASE_URL}/users/user/progress",
-            headers=headers
-        )
-        
-        if response.status_code == 200:
-            progress_data = response.json()
-            
-            # Display metrics in columns
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric(
-                    "Total Problems",
-                    value=50,  # Total problems available
-                    delta=f"+{len(st.session_state.completed_questions)} solved"
-                )
-            with col2:
-                completion_rate = (len(st.session_state.completed_questions) / 50) * 100
-                st.metric(
-                    "Completion Rate",
-                    value=f"{completion_rate:.1f}%",
-                    delta="↗️" if completion_rate > 50 else "↘️"
-                )
-            with col3:
-                st.metric(
-                    "Time Invested",
-                    value="12hrs",
-                    delta="2hrs this week"
-                )
+        # Same per-token cache treatment as the articles list
+        progress_data = _fetch_progress(st.session_state.token)
 
+        # Display metrics in columns
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric(
+                "Total Problems",
+                value=50,  # Total problems available
+                delta=f"+{solved_count()} solved"
+            )
+        with col2:
+            completion_rate = completion_pct()
+            st.metric(
+                "Completion Rate",
+                value=f"{completion_rate:.1f}%",
+                delta="↗️" if completion_rate > 50 else "↘️"
+            )
+        with col3:
+            st.metric(
+                "Time Invested",
+                value="12hrs",
+                delta="2hrs this week"
+            )
+
+
+        # Add a progress bar
+        st.subheader("🎯 Overall Progress")
+        st.progress(completion_rate/100)
+        
+        # Add mock data for visualization
+        st.subheader("📈 Performance Trends")
+        st.line_chart(_perf_trends_df())
+        
+        # Add a mock difficulty breakdown: one chart element instead of
+        # three columns of markdown/progress/caption widgets
+        st.subheader("💪 Difficulty Breakdown")
+        st.bar_chart(_difficulty_df())
+
+        # Display raw data in expander
+        with st.expander("🔍 Raw Progress Data"):
+            st.json(progress_data)
 
-            # Add a progress bar
-            st.subheader("🎯 Overall Progress")
-            st.progress(completion_rate/100)
-            
-            # Add mock data for visualization
-            st.subheader("📈 Performance Trends")
-            chart_data = {
-                'Week': ['W1', 'W2', 'W3', 'W4'],
-                'Problems Solved': [5, 8, 12, 15],
-                'Avg Time (min)': [45, 40, 35, 30]
-            }
-            st.line_chart(chart_data)
-            
-            # Add a mock difficulty breakdown
-            st.subheader("💪 Difficulty Breakdown")
-            cols = st.columns(3)
-            difficulties = {
-                "Easy": 60,
-                "Medium": 35,
-                "Hard": 20
-            }
-            for i, (diff, percent) in enumerate(difficulties.items()):
-                with cols[i]:
-                    st.markdown(f"### {diff}")
-                    st.progress(percent/100)
-                    st.caption(f"{percent}% success rate")
-
-            # Display raw data in expander
-            with st.expander("🔍 Raw Progress Data"):
-                st.json(progress_data)
-            
-        else:
-            st.error(f"Error: {response.status_code} - {response.text}")
-            
     except Exception as e:
         st.error(f"Error fetching progress: {str(e)}")
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def _ai_assist(question, token, _raw_question):
+    """AI assist responses, cached so a repeated question skips the model.
+
+    `question` is the normalized cache key only; the model gets the
+    user's original text (`_raw_question`, excluded from the key by the
+    leading underscore) so identifiers and notation survive intact.
+    """
+    response = SESSION.post(
+        f"{API_BASE_URL}/ai/assist",
+        headers=_auth_headers(token),
+        json={"question": _raw_question},
+        timeout=(CONNECT_TIMEOUT, 60)
+    )
+    response.raise_for_status()
+    return response.json()
+
+@st.fragment
 def display_ai_assistance():
     st.header("🤖 AI Learning Assistant")
-    
+
     if 'token' not in st.session_state:
         st.error("Please login first")
         return
-        
+
     with st.expander("Get Personalized Help"):
         user_question = st.text_area("Ask your DSA question:")
         if st.button("Get AI Help"):
             with st.spinner("Thinking..."):
                 try:
-                    response = requests.post(
-                        f"{API_BASE_URL}/ai/assist",
-                        headers={
-                            "Authorization": f"Bearer {st.session_state.token}",
-                            "Content-Type": "application/json"
-                        },
-                        json={"question": user_question}
+                    # Key normalized so trivial rephrasings hit the
+                    # cache; the request body keeps the original text
+                    ai_response = _ai_assist(
+                        user_question.strip().lower(),
+                        st.session_state.token,
+                        user_question
                     )
-                    
-                    if response.status_code == 200:
-                        ai_response = response.json()
-                        st.markdown("### 💡 AI Response")
-                        st.markdown(ai_response.get('response', ''))
-                        
-                        if 'code_example' in ai_response:
-                            st.markdown("### 📝 Code Example")
-                            st.code(ai_response['code_example'], language='python')
-                    else:
-                        st.error("Failed to get AI response")
-                        
+                    st.markdown("### 💡 AI Response")
+                    st.markdown(ai_response.get('response', ''))
+
+                    if 'code_example' in ai_response:
+                        st.markdown("### 📝 Code Example")
+                        st.code(ai_response['code_example'], language='python')
+                except requests.exceptions.HTTPError:
+                    st.error("Failed to get AI response")
                 except Exception as e:
                     st.error(f"Error: {str(e)}")
 
-def main():
-    # Initialize session state
-    init_session_state()
-    
-    # Custom CSS for a more technical look
-    st.markdown("""
+# Static page chrome, built once at import: reruns pass the same
+# string objects instead of rebuilding ~6 KB of markup each time
+_CSS = """
         <style>
         .main {
             background-color: #0E1117;
@@ -617,41 +680,9 @@ def main():
             margin-right: 20px;
         }
         </style>
-    """, unsafe_allow_html=True)
+    """
 
-    if st.session_state.token is None:
-        # Logo and Title for login page
-        col1, col2 = st.columns([0.25, 5])
-        with col1:
-            st.markdown('<div class="logo-icon">👽</div>', unsafe_allow_html=True)
-        with col2:
-            st.markdown('<div class="logo-text">DSA Tutor Pro</div>', unsafe_allow_html=True)
-            st.markdown('<div class="logo-subtitle">Master Data Structures & Algorithms</div>', unsafe_allow_html=True)
-
-        # Login page content
-        col1, col2 = st.columns([1, 1])
-        with col1:
-            with st.container():
-                st.markdown("""
-                    ### 🚀 Welcome to DSA Tutor Pro
-                    Your personal guide to mastering algorithms
-                    
-                    - 📚 Curated DSA content
-                    - 💡 Interactive learning
-                    - 📊 Progress tracking
-                    - 🤖 AI-powered assistance
-                    - ⚡ Real-time feedback
-                    - 🎯 Targeted practice
-                """)
-        with col2:
-            tab1, tab2 = st.tabs(["🔑 Login", "📝 Sign Up"])
-            with tab1:
-                login()
-            with tab2:
-                signup()
-    else:
-        # Combined header with logo and quote
-        st.markdown("""
+_HEADER_HTML = """
             <div class="header-container">
                 <div class="title-section">
                     <div class="logo-container">
@@ -674,15 +705,48 @@ def main():
                     </div>
                 </div>
             </div>
-        """, unsafe_allow_html=True)
+        """
 
-        # Sidebar with user info and stats
-        with st.sidebar:
-            st.markdown("""
+_SIDEBAR_LOGO_HTML = """
                 <div style='text-align: center; margin-bottom: 2rem;'>
                     <div class="logo-text" style='font-size: 2rem;'><span class="sidebar-logo">👽</span> DSA Pro</div>
                 </div>
-            """, unsafe_allow_html=True)
+            """
+
+def main():
+    # Initialize session state
+    init_session_state()
+    
+    # Custom CSS for a more technical look (constant shipped as-is)
+    st.markdown(_CSS, unsafe_allow_html=True)
+
+    if st.session_state.token is None:
+        # Logo and Title for login page
+        col1, col2 = st.columns([0.25, 5])
+        with col1:
+            st.markdown('<div class="logo-icon">👽</div>', unsafe_allow_html=True)
+        with col2:
+            st.markdown('<div class="logo-text">DSA Tutor Pro</div>', unsafe_allow_html=True)
+            st.markdown('<div class="logo-subtitle">Master Data Structures & Algorithms</div>', unsafe_allow_html=True)
+
+        # Login page content
+        col1, col2 = st.columns([1, 1])
+        with col1:
+            with st.container():
+                st.markdown(_WELCOME_MD)
+        with col2:
+            tab1, tab2 = st.tabs(["🔑 Login", "📝 Sign Up"])
+            with tab1:
+                login()
+            with tab2:
+                signup()
+    else:
+        # Combined header with logo and quote
+        st.markdown(_HEADER_HTML, unsafe_allow_html=True)
+
+        # Sidebar with user info and stats
+        with st.sidebar:
+            st.markdown(_SIDEBAR_LOGO_HTML, unsafe_allow_html=True)
             
             st.markdown("### 👤 User Dashboard")
             st.success("🟢 Logged in successfully!")
@@ -691,17 +755,28 @@ def main():
             st.markdown("### 📊 Quick Stats")
             col1, col2 = st.columns(2)
             with col1:
-                st.metric("Questions", len(st.session_state.completed_questions))
+                st.metric("Questions", solved_count())
             with col2:
-                progress_percent = len(st.session_state.completed_questions) * 100 / 50  # Assuming 50 total questions
-                st.metric("Progress", f"{progress_percent:.1f}%")
+                st.metric("Progress", f"{completion_pct():.1f}%")
             
             if st.button("🚪 Logout", type="primary"):
-                for key in st.session_state.keys():
-                    del st.session_state[key]
-                st.experimental_rerun()
+                # Drop this user's cached payloads along with the session;
+                # one clear() instead of deleting keys mid-iteration
+                _fetch_articles.clear()
+                _fetch_progress.clear()
+                _ai_assist.clear()
+                st.session_state.clear()
+                st.rerun()
+
+            # Escape hatch for the cached URL probe, e.g. after moving
+            # the backend to another host
+            if st.button("🔄 Re-detect backend"):
+                get_working_api_url.clear()
+                st.rerun()
 
-        # Main content area
+        # Main content area: warm both payload caches in parallel
+        # before the tabs render and read them back
+        _prefetch(st.session_state.token)
         tab1, tab2, tab3 = st.tabs(["📚 Learning Hub", "📈 Progress Analytics", "🤖 AI Assistant"])
         with tab1:
             display_articles()
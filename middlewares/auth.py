@@ -1,6 +1,29 @@
+import logging
 from functools import wraps
-from flask import request, jsonify
-from app import supabase  
+from flask import g, request, jsonify
+from app import get_supabase
+from app.cache import role_cache
+
+log = logging.getLogger(__name__)
+
+def get_role(user_id):
+    """Resolve a user's role, memoized per request and for a short TTL"""
+    roles = getattr(g, "_role_cache", None)
+    if roles is None:
+        roles = g._role_cache = {}
+    if user_id in roles:
+        return roles[user_id]
+
+    role = role_cache.get(user_id)
+    if role is None:
+        user_data = get_supabase().table("users").select("role").eq("id", user_id).execute()
+        if not user_data.data or len(user_data.data) == 0:
+            return None
+        role = user_data.data[0]["role"]
+        role_cache.set(user_id, role)
+
+    roles[user_id] = role
+    return role
 
 def token_required(f):
     """Middleware to check authentication token"""
@@ -16,7 +39,7 @@ def token_required(f):
 
         try:
             # ✅ Decode token and get user info
-            response = supabase.auth.get_user(token)
+            response = get_supabase().auth.get_user(token)
 
             # ✅ Fix: Access `user` property correctly
             if not response or not hasattr(response, "user") or not response.user:
@@ -24,22 +47,20 @@ def token_required(f):
 
             user_id = response.user.id  # ✅ Extract the UUID from the token
 
-            # ✅ Fix: Ensure the user exists in `users` table
-            user_data = supabase.table("users").select("role").eq("id", user_id).execute()
-
-            # ✅ Fix: Properly check if user exists
-            if not user_data.data or len(user_data.data) == 0:
+            # ✅ Cached role lookup also confirms the user exists in `users`
+            role = get_role(user_id)
+            if role is None:
                 return jsonify({"error": "User not found in database!"}), 404
 
             user = {
                 "id": user_id,
-                "role": user_data.data[0]["role"]
+                "role": role
             }
 
             return f(user, *args, **kwargs)
 
         except Exception as e:
-            print("🚨 Token Error:", str(e))  # Debugging
+            log.warning("Token error: %s", e)
             return jsonify({"error": "Token verification failed"}), 403
 
     return decorated_function
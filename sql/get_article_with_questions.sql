@@ -0,0 +1,15 @@
+-- Composite query for GET /api/articles/<id>/questions.
+-- Fetches the article and its category's practice questions in one
+-- round-trip (categories are not unique in articles, so a PostgREST
+-- embed FK is not possible here).
+-- Run this in the Supabase SQL editor to deploy.
+CREATE OR REPLACE FUNCTION get_article_with_questions(aid text) RETURNS json AS $$
+    SELECT CASE WHEN a.id IS NULL THEN NULL ELSE json_build_object(
+        'article', row_to_json(a),
+        'related_questions', COALESCE(
+            (SELECT json_agg(q) FROM practicequestions q WHERE q.category = a.category),
+            '[]'::json
+        )
+    ) END
+    FROM articles a WHERE a.id::text = aid;
+$$ LANGUAGE sql STABLE;
@@ -0,0 +1,12 @@
+-- Composite dashboard query for GET /api/user/progress.
+-- Returns everything the route needs in a single round-trip instead of
+-- three sequential queries (userprogress, articles, users).
+-- Run this in the Supabase SQL editor to deploy.
+CREATE OR REPLACE FUNCTION get_user_dashboard(uid uuid) RETURNS json AS $$
+    SELECT json_build_object(
+        'total_articles', (SELECT count(*) FROM articles),
+        'completed_articles', (SELECT count(*) FROM userprogress WHERE user_id = uid),
+        'role', COALESCE((SELECT role FROM users WHERE id = uid), 'user'),
+        'progress_data', COALESCE((SELECT json_agg(p) FROM userprogress p WHERE p.user_id = uid), '[]'::json)
+    );
+$$ LANGUAGE sql STABLE;
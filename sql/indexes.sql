@@ -0,0 +1,22 @@
+-- Indexes backing the hot filters used by the API routes.
+-- The unique (user_id, article_id) pair already exists as a constraint
+-- (see userprogress_constraints.sql) and doubles as the lookup index for
+-- the mark-as-read upsert.
+-- Verify plans with EXPLAIN ANALYZE after deploying; each route filter
+-- should show an Index Scan / Index Only Scan.
+-- Run these in the Supabase SQL editor (CONCURRENTLY avoids write locks).
+CREATE INDEX CONCURRENTLY IF NOT EXISTS userprogress_user_id_idx
+    ON userprogress (user_id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS practicequestions_category_idx
+    ON practicequestions (category);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS articles_category_idx
+    ON articles (category);
+
+-- Signup existence check filters users by plain email equality, which a
+-- functional lower(email) index cannot serve. The API stores emails
+-- lowercased, so a direct unique index both backs that lookup and stops
+-- case-variant duplicates.
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS users_email_key
+    ON users (email);
@@ -0,0 +1,15 @@
+-- Constraints backing the single-upsert mark-as-read path.
+-- The unique pair lets POST /api/articles/<id>/mark-read use
+-- ON CONFLICT DO NOTHING, and the FK rejects unknown article ids
+-- (error 23503) instead of requiring a pre-check query.
+-- Run this in the Supabase SQL editor to deploy.
+ALTER TABLE userprogress
+    ADD CONSTRAINT userprogress_user_article_key UNIQUE (user_id, article_id);
+
+ALTER TABLE userprogress
+    ADD CONSTRAINT userprogress_article_id_fkey
+    FOREIGN KEY (article_id) REFERENCES articles (id);
+
+-- Let Postgres stamp completion time so the API write payload stays minimal.
+ALTER TABLE userprogress
+    ALTER COLUMN completed_at SET DEFAULT now();